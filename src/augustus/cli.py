@@ -5,6 +5,7 @@ All business logic should be delegated to other modules.
 """
 
 from pathlib import Path
+from typing import Optional
 
 import typer
 from rich.console import Console
@@ -12,7 +13,6 @@ from rich.panel import Panel
 from typing_extensions import Annotated
 
 from augustus import __version__
-from augustus.ingest.index import VectorIndex, ingest_dry_run, ingest_folder
 
 app = typer.Typer(
     name="augustus",
@@ -69,8 +69,27 @@ def ingest(
         int,
         typer.Option("--chunk-overlap", help="Overlap between chunks"),
     ] = 200,
+    workers: Annotated[
+        Optional[int],
+        typer.Option(
+            "--workers",
+            min=1,
+            help="Worker processes for loading and splitting files "
+            "(default: CPU count)",
+        ),
+    ] = None,
+    pathspec: Annotated[
+        bool,
+        typer.Option(
+            "--pathspec",
+            help='Match ignore patterns with pathspec (needs "augustus[gitignore]")',
+        ),
+    ] = False,
 ) -> None:
     """Ingest a folder's contents and build a searchable index."""
+    # Imported here so --help and --version don't pay for LangChain/FAISS
+    from augustus.ingest.index import ingest_dry_run, ingest_folder
+
     folder_path = Path(path).resolve()
 
     if not folder_path.exists():
@@ -83,7 +102,16 @@ def ingest(
 
     if dry_run:
         console.print("[dim]Running in dry-run mode (no index created)[/dim]\n")
-        summary = ingest_dry_run(folder_path, sample_size=sample_size)
+        try:
+            summary = ingest_dry_run(
+                folder_path,
+                sample_size=sample_size,
+                workers=workers,
+                use_pathspec=pathspec,
+            )
+        except ImportError as e:
+            console.print(f"[red]Error:[/red] {e}")
+            raise typer.Exit(code=1)
 
         console.print(f"files discovered: {summary.discovered}")
         console.print(f"ignored: {summary.ignored}")
@@ -103,6 +131,8 @@ def ingest(
                     folder_path,
                     chunk_size=chunk_size,
                     chunk_overlap=chunk_overlap,
+                    workers=workers,
+                    use_pathspec=pathspec,
                 )
 
             console.print(
@@ -144,6 +174,8 @@ def ask(
     This command will be fully implemented in a future step.
     Currently shows retrieved context only.
     """
+    from augustus.ingest.index import VectorIndex
+
     folder_path = Path(path).resolve()
     index = VectorIndex(folder_path)
 
@@ -197,6 +229,8 @@ def list_files(
 
     This command will be implemented in a future step.
     """
+    from augustus.ingest.index import VectorIndex
+
     folder_path = Path(path).resolve()
     index = VectorIndex(folder_path)
 
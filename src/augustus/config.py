@@ -17,6 +17,8 @@ DEFAULT_CONFIG_DIR = Path.home() / ".augustus"
 # Embedding configuration
 DEFAULT_EMBEDDING_MODEL = "text-embedding-ada-002"
 DEFAULT_EMBEDDING_PROVIDER = "openai"
+DEFAULT_EMBED_BATCH_SIZE = 512  # texts per embedding request
+DEFAULT_EMBED_CONCURRENCY = 8  # embedding requests in flight
 
 # Chunking configuration
 DEFAULT_CHUNK_SIZE = 1000
@@ -26,6 +28,12 @@ DEFAULT_CHUNK_OVERLAP = 200
 DEFAULT_TOP_K = 5
 DEFAULT_SIMILARITY_THRESHOLD = 0.7
 
+# Vector index configuration (below HNSW_MIN_VECTORS search is exact)
+HNSW_MIN_VECTORS = 10_000
+HNSW_M = 32
+HNSW_EF_CONSTRUCTION = 200
+HNSW_EF_SEARCH = 64
+
 # Ignore patterns (similar to .gitignore)
 DEFAULT_IGNORE_PATTERNS: List[str] = [
     # Version control
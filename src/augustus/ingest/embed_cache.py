@@ -0,0 +1,98 @@
+"""Embedding cache for Augustus.
+
+This module stores embedding vectors on disk, keyed by embedding model and
+chunk content hash, so re-ingesting unchanged content skips the embedding API.
+"""
+
+import hashlib
+import sqlite3
+from array import array
+from pathlib import Path
+from typing import Dict, Iterable, Sequence, Tuple
+
+# Cache file name (stored inside the index directory)
+CACHE_FILE_NAME = "embed_cache.db"
+
+# SQLite limits the number of bound parameters per statement
+_LOOKUP_BATCH_SIZE = 500
+
+
+def content_hash(text: str) -> str:
+    """Return the cache key for a chunk's text."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    """SQLite-backed store of float32 embedding vectors.
+
+    Use as a context manager so the connection is always closed.
+    """
+
+    def __init__(self, db_path: Path):
+        """Open (or create) the cache database.
+
+        Args:
+            db_path: Path to the SQLite file
+        """
+        self.db_path = db_path
+        self._conn = sqlite3.connect(str(db_path))
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS emb ("
+            "model TEXT NOT NULL, hash TEXT NOT NULL, vec BLOB NOT NULL, "
+            "PRIMARY KEY (model, hash))"
+        )
+
+    def __enter__(self) -> "EmbeddingCache":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def get_many(self, model: str, hashes: Iterable[str]) -> Dict[str, Sequence[float]]:
+        """Look up cached vectors.
+
+        Args:
+            model: Embedding model name
+            hashes: Content hashes to look up
+
+        Returns:
+            Mapping of hash to float32 array for every hash found
+        """
+        keys = list(hashes)
+        found: Dict[str, Sequence[float]] = {}
+
+        for start in range(0, len(keys), _LOOKUP_BATCH_SIZE):
+            batch = keys[start : start + _LOOKUP_BATCH_SIZE]
+            placeholders = ",".join("?" * len(batch))
+            rows = self._conn.execute(
+                "SELECT hash, vec FROM emb "
+                f"WHERE model = ? AND hash IN ({placeholders})",
+                [model, *batch],
+            )
+            for key, blob in rows:
+                vector = array("f")
+                vector.frombytes(blob)
+                found[key] = vector
+
+        return found
+
+    def put_many(
+        self,
+        model: str,
+        items: Iterable[Tuple[str, Sequence[float]]],
+    ) -> None:
+        """Store vectors as float32.
+
+        Args:
+            model: Embedding model name
+            items: (hash, vector) pairs to store
+        """
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO emb (model, hash, vec) VALUES (?, ?, ?)",
+            ((model, key, array("f", vector).tobytes()) for key, vector in items),
+        )
+        self._conn.commit()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
@@ -4,12 +4,34 @@ This module handles creating and managing the FAISS vector index
 for semantic search over document chunks.
 """
 
+import asyncio
+import itertools
+import json
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional
-
-from augustus.ingest.loader import LoadedDocument, load_folder
-from augustus.ingest.splitter import DocumentChunk, split_documents
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional
+
+from augustus.config import (
+    DEFAULT_EMBED_BATCH_SIZE,
+    DEFAULT_EMBED_CONCURRENCY,
+    HNSW_EF_CONSTRUCTION,
+    HNSW_EF_SEARCH,
+    HNSW_M,
+    HNSW_MIN_VECTORS,
+)
+from augustus.ingest.embed_cache import CACHE_FILE_NAME, EmbeddingCache, content_hash
+from augustus.ingest.loader import LoadedDocument, load_folder, load_records
+from augustus.ingest.manifest import (
+    MANIFEST_FILE_NAME,
+    ManifestEntry,
+    read_manifest,
+    write_manifest,
+)
+from augustus.ingest.splitter import DocumentChunk, iter_document_chunks
+from augustus.utils.file_tree import collect_files
+from augustus.utils.ignore import build_ignore_spec
 
 # Index directory name (stored inside the indexed folder)
 INDEX_DIR_NAME = ".augustus"
@@ -28,10 +50,137 @@ class IngestSummary:
     sample_paths: List[str]
 
 
+def _embed_texts(
+    embeddings: Any,
+    texts: List[str],
+    batch_size: int = DEFAULT_EMBED_BATCH_SIZE,
+    concurrency: int = DEFAULT_EMBED_CONCURRENCY,
+) -> List[List[float]]:
+    """Embed texts in batches with several requests in flight at once.
+
+    Rate-limited (429) requests are retried with backoff by the OpenAI client.
+
+    Args:
+        embeddings: Embeddings object exposing aembed_documents
+        texts: Texts to embed
+        batch_size: Number of texts per request
+        concurrency: Maximum number of concurrent requests
+
+    Returns:
+        One vector per text, in input order
+    """
+    batches = [texts[i : i + batch_size] for i in range(0, len(texts), batch_size)]
+
+    async def embed_all() -> List[List[List[float]]]:
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def embed_batch(batch: List[str]) -> List[List[float]]:
+            async with semaphore:
+                return await embeddings.aembed_documents(batch)
+
+        return await asyncio.gather(*(embed_batch(batch) for batch in batches))
+
+    results = asyncio.run(embed_all())
+    return [vector for batch_vectors in results for vector in batch_vectors]
+
+
+def _create_faiss_index(dimension: int, count: int) -> Any:
+    """Create an empty FAISS index suited to the number of vectors.
+
+    Small indexes use exact brute-force search. From HNSW_MIN_VECTORS up,
+    an HNSW graph keeps query time roughly logarithmic in the index size,
+    and vectors are stored as 8-bit scalars (4x smaller than float32).
+    That index must be trained before vectors are added.
+
+    Args:
+        dimension: Vector dimension
+        count: Number of vectors that will be added
+
+    Returns:
+        Empty FAISS index using L2 distance
+    """
+    import faiss
+
+    if count < HNSW_MIN_VECTORS:
+        return faiss.IndexFlatL2(dimension)
+
+    index = faiss.IndexHNSWSQ(dimension, faiss.ScalarQuantizer.QT_8bit, HNSW_M)
+    index.hnsw.efConstruction = HNSW_EF_CONSTRUCTION
+    index.hnsw.efSearch = HNSW_EF_SEARCH
+    return index
+
+
+def _embed_window(
+    cache: EmbeddingCache,
+    embeddings: Any,
+    embedding_model: str,
+    texts: List[str],
+    batch_size: int,
+    concurrency: int,
+) -> Any:
+    """Embed a window of texts, reusing vectors from the cache.
+
+    Args:
+        cache: Open embedding cache
+        embeddings: Embeddings object exposing aembed_documents
+        embedding_model: Embedding model name (cache key)
+        texts: Texts to embed
+        batch_size: Number of texts per request
+        concurrency: Maximum number of concurrent requests
+
+    Returns:
+        float32 matrix with one row per text
+    """
+    import numpy as np
+
+    hashes = [content_hash(text) for text in texts]
+    known = cache.get_many(embedding_model, set(hashes))
+    missing = {key: text for key, text in zip(hashes, texts) if key not in known}
+    if missing:
+        fresh = _embed_texts(
+            embeddings, list(missing.values()), batch_size, concurrency
+        )
+        new_vectors = dict(zip(missing, fresh))
+        cache.put_many(embedding_model, new_vectors.items())
+        known.update(new_vectors)
+
+    # Fill one contiguous float32 matrix rather than a list of float lists
+    vectors = np.empty((len(hashes), len(known[hashes[0]])), dtype=np.float32)
+    for row, key in enumerate(hashes):
+        vectors[row] = known[key]
+    return vectors
+
+
+def _batched(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """Yield lists of up to size items."""
+    iterator = iter(items)
+    while batch := list(itertools.islice(iterator, size)):
+        yield batch
+
+
+def _index_from_sample(vectors: Any, count: int) -> Any:
+    """Create a FAISS index for count vectors, train it and add the sample.
+
+    Args:
+        vectors: First vectors of the stream (float32 matrix)
+        count: Number of vectors seen so far
+
+    Returns:
+        FAISS index holding the sample vectors
+    """
+    faiss_index = _create_faiss_index(vectors.shape[1], count)
+    if not faiss_index.is_trained:
+        faiss_index.train(vectors)
+    faiss_index.add(vectors)
+    return faiss_index
+
+
 class VectorIndex:
     """Local vector index for semantic search using FAISS.
 
-    The index is stored in .augustus/ inside the indexed folder.
+    The index is stored in .augustus/ inside the indexed folder as the raw
+    FAISS index (index.faiss) plus a columnar docstore (docstore.json)
+    holding chunk ids, contents and metadata as parallel lists.
     """
 
     def __init__(self, folder_path: Path):
@@ -43,18 +192,34 @@ class VectorIndex:
         self.folder_path = folder_path.resolve()
         self.index_dir = self.folder_path / INDEX_DIR_NAME
         self.index_path = self.index_dir / INDEX_FILE_NAME
-        self._vectorstore = None
+        self.docstore_path = self.index_dir / DOCSTORE_FILE_NAME
+        self._index = None
+        self._embeddings = None
+        self._embedding_model = ""
+        self._ids: List[str] = []
+        self._contents: List[str] = []
+        self._metadatas: List[Mapping[str, object]] = []
 
     def build(
         self,
-        chunks: List[DocumentChunk],
+        chunks: Iterable[DocumentChunk],
         embedding_model: str = "text-embedding-3-small",
+        batch_size: int = DEFAULT_EMBED_BATCH_SIZE,
+        concurrency: int = DEFAULT_EMBED_CONCURRENCY,
     ) -> int:
         """Build the vector index from chunks.
 
+        Chunks are consumed as a stream: each window of
+        batch_size * concurrency chunks is embedded and added to the index
+        before the next one is pulled, so vectors never pile up for the whole
+        corpus. Only the first HNSW_MIN_VECTORS vectors are held back, to pick
+        the index type and train it.
+
         Args:
-            chunks: List of DocumentChunk objects to index
+            chunks: DocumentChunk objects to index (any iterable)
             embedding_model: OpenAI embedding model to use
+            batch_size: Number of texts per embedding request
+            concurrency: Maximum number of concurrent embedding requests
 
         Returns:
             Number of chunks indexed
@@ -62,33 +227,76 @@ class VectorIndex:
         Raises:
             ValueError: If no chunks provided or API key missing
         """
-        if not chunks:
+        chunk_iter = iter(chunks)
+        first = next(chunk_iter, None)
+        if first is None:
             raise ValueError("No chunks to index")
 
-        import os
-
         if not os.getenv("OPENAI_API_KEY"):
             raise ValueError(
                 "OPENAI_API_KEY environment variable not set. "
                 "Set it with: export OPENAI_API_KEY=your-key"
             )
 
-        from langchain_community.vectorstores import FAISS
+        import numpy as np
         from langchain_openai import OpenAIEmbeddings
 
-        # Prepare texts and metadatas for FAISS
-        texts = [chunk.content for chunk in chunks]
-        metadatas = [chunk.metadata for chunk in chunks]
+        embeddings = OpenAIEmbeddings(model=embedding_model, chunk_size=batch_size)
+        window_size = batch_size * concurrency
 
-        # Create embeddings and build index
-        embeddings = OpenAIEmbeddings(model=embedding_model)
-        self._vectorstore = FAISS.from_texts(
-            texts=texts,
-            embedding=embeddings,
-            metadatas=metadatas,
-        )
+        ids: List[str] = []
+        texts: List[str] = []
+        metadatas: List[Mapping[str, object]] = []
+        faiss_index = None
+        pending: List[Any] = []  # vector windows held until the index exists
 
-        return len(chunks)
+        self.index_dir.mkdir(parents=True, exist_ok=True)
+        # FAISS releases the GIL while adding, so one window is added on a
+        # worker thread while the next is being embedded. Waiting for the
+        # previous add keeps at most one window in flight.
+        adding: Optional[Future] = None
+        cache = EmbeddingCache(self.index_dir / CACHE_FILE_NAME)
+        with cache, ThreadPoolExecutor(max_workers=1) as adder:
+            for window in _batched(itertools.chain([first], chunk_iter), window_size):
+                window_texts = [chunk.content for chunk in window]
+                vectors = _embed_window(
+                    cache,
+                    embeddings,
+                    embedding_model,
+                    window_texts,
+                    batch_size,
+                    concurrency,
+                )
+
+                ids.extend(chunk.id for chunk in window)
+                texts.extend(window_texts)
+                metadatas.extend(chunk.metadata for chunk in window)
+
+                if faiss_index is not None:
+                    if adding is not None:
+                        adding.result()
+                    adding = adder.submit(faiss_index.add, vectors)
+                    continue
+
+                pending.append(vectors)
+                if len(ids) >= HNSW_MIN_VECTORS:
+                    faiss_index = _index_from_sample(np.vstack(pending), len(ids))
+                    pending = []
+
+            if adding is not None:
+                adding.result()
+
+        if faiss_index is None:
+            faiss_index = _index_from_sample(np.vstack(pending), len(ids))
+
+        self._index = faiss_index
+        self._embeddings = embeddings
+        self._embedding_model = embedding_model
+        self._ids = ids
+        self._contents = texts
+        self._metadatas = metadatas
+
+        return len(ids)
 
     def save(self) -> Path:
         """Save the index to disk.
@@ -99,14 +307,28 @@ class VectorIndex:
         Raises:
             ValueError: If no index has been built
         """
-        if self._vectorstore is None:
+        if self._index is None:
             raise ValueError("No index to save. Call build() first.")
 
+        import faiss
+
         # Create index directory
         self.index_dir.mkdir(parents=True, exist_ok=True)
 
-        # Save FAISS index
-        self._vectorstore.save_local(str(self.index_dir))
+        # Save FAISS index and the docstore columns (no pickle involved).
+        # The index is written aside and swapped in, because a running query
+        # may have the old file memory-mapped.
+        tmp_index_path = self.index_path.with_suffix(".tmp")
+        faiss.write_index(self._index, str(tmp_index_path))
+        os.replace(tmp_index_path, self.index_path)
+        columns = {
+            "embedding_model": self._embedding_model,
+            "ids": self._ids,
+            "contents": self._contents,
+            "metadatas": [dict(metadata) for metadata in self._metadatas],
+        }
+        with open(self.docstore_path, "w", encoding="utf-8") as f:
+            json.dump(columns, f, ensure_ascii=False, separators=(",", ":"))
 
         return self.index_dir
 
@@ -119,35 +341,66 @@ class VectorIndex:
         if not self.exists():
             return False
 
-        import os
-
         if not os.getenv("OPENAI_API_KEY"):
             raise ValueError(
                 "OPENAI_API_KEY environment variable not set. "
                 "Set it with: export OPENAI_API_KEY=your-key"
             )
 
-        from langchain_community.vectorstores import FAISS
+        import faiss
         from langchain_openai import OpenAIEmbeddings
 
-        embeddings = OpenAIEmbeddings(model="text-embedding-3-small")
-        self._vectorstore = FAISS.load_local(
-            str(self.index_dir),
-            embeddings,
-            allow_dangerous_deserialization=True,
+        with open(self.docstore_path, "r", encoding="utf-8") as f:
+            columns = json.load(f)
+
+        self._embedding_model = columns["embedding_model"]
+        self._ids = columns["ids"]
+        self._contents = columns["contents"]
+        self._metadatas = columns["metadatas"]
+        self._embeddings = OpenAIEmbeddings(model=self._embedding_model)
+
+        # Map stored vectors instead of copying them, so start-up does not
+        # depend on index size. Older FAISS releases only have IO_FLAG_MMAP.
+        mmap_flag = getattr(faiss, "IO_FLAG_MMAP_IFC", faiss.IO_FLAG_MMAP)
+        self._index = faiss.read_index(
+            str(self.index_path), mmap_flag | faiss.IO_FLAG_READ_ONLY
         )
         return True
 
+    def stored_chunks(self) -> List[DocumentChunk]:
+        """Read the chunks saved in the docstore.
+
+        Unlike load(), this needs neither the FAISS index nor an API key.
+
+        Returns:
+            Saved chunks in index order (empty if there is no docstore)
+        """
+        if not self.docstore_path.exists():
+            return []
+
+        with open(self.docstore_path, "r", encoding="utf-8") as f:
+            columns = json.load(f)
+
+        return [
+            DocumentChunk(
+                id=chunk_id,
+                content=content,
+                source_path=metadata["source"],
+                chunk_index=metadata["chunk_index"],
+                metadata=metadata,
+            )
+            for chunk_id, content, metadata in zip(
+                columns["ids"], columns["contents"], columns["metadatas"]
+            )
+        ]
+
     def exists(self) -> bool:
         """Check if an index exists at the configured path.
 
         Returns:
             True if index exists, False otherwise
         """
-        # FAISS saves as index.faiss and index.pkl
-        faiss_file = self.index_dir / "index.faiss"
-        pkl_file = self.index_dir / "index.pkl"
-        return faiss_file.exists() and pkl_file.exists()
+        return self.index_path.exists() and self.docstore_path.exists()
 
     def search(self, query: str, k: int = 5) -> List[dict]:
         """Search the index for similar documents.
@@ -159,19 +412,26 @@ class VectorIndex:
         Returns:
             List of results with content, metadata, and score
         """
-        if self._vectorstore is None:
+        if self._index is None:
             if not self.load():
                 return []
 
-        results = self._vectorstore.similarity_search_with_score(query, k=k)
+        import numpy as np
+
+        query_vector = np.asarray(
+            [self._embeddings.embed_query(query)], dtype=np.float32
+        )
+        distances, positions = self._index.search(query_vector, k)
 
+        # FAISS pads with -1 when the index holds fewer than k vectors
         return [
             {
-                "content": doc.page_content,
-                "metadata": doc.metadata,
-                "score": float(score),
+                "content": self._contents[position],
+                "metadata": self._metadatas[position],
+                "score": score,
             }
-            for doc, score in results
+            for position, score in zip(positions[0].tolist(), distances[0].tolist())
+            if position != -1
         ]
 
 
@@ -181,47 +441,116 @@ def ingest_folder(
     chunk_size: int = 1000,
     chunk_overlap: int = 200,
     embedding_model: str = "text-embedding-3-small",
+    workers: Optional[int] = None,
+    use_pathspec: bool = False,
 ) -> IngestSummary:
     """Ingest a folder: load files, chunk, embed, and save index.
 
+    Files whose size and modification time match the manifest of the
+    previous ingest are not read again; their chunks are taken from the
+    saved docstore and their vectors from the embedding cache.
+
     Args:
         folder_path: Path to folder to ingest
         ignore_patterns: Additional patterns to ignore
         chunk_size: Size of text chunks
         chunk_overlap: Overlap between chunks
         embedding_model: OpenAI embedding model to use
+        workers: Number of worker processes for loading and splitting files
+        use_pathspec: Match ignore patterns with pathspec
 
     Returns:
         IngestSummary with statistics
     """
-    # Load documents
-    loaded, discovered, ignored = load_folder(folder_path, ignore_patterns)
+    ignore_spec = build_ignore_spec(folder_path, ignore_patterns, use_pathspec)
+    records, ignored = collect_files(folder_path, ignore_spec=ignore_spec)
+
+    index = VectorIndex(folder_path)
+    manifest_path = index.index_dir / MANIFEST_FILE_NAME
+    previous: Dict[str, ManifestEntry] = {}
+    if index.exists():
+        previous = read_manifest(manifest_path, chunk_size, chunk_overlap)
+
+    # Reuse the manifest entry of every file whose fingerprint is unchanged
+    manifest: Dict[str, ManifestEntry] = {}
+    changed = []
+    for record in records:
+        entry = previous.get(record.relative_path)
+        if entry is not None and (entry.size_bytes, entry.mtime_ns) == (
+            record.size_bytes,
+            record.mtime_ns,
+        ):
+            manifest[record.relative_path] = entry
+        else:
+            changed.append(record)
+
+    chunks_by_path: Dict[str, List[DocumentChunk]] = {}
+    if manifest:
+        for chunk in index.stored_chunks():
+            if chunk.source_path in manifest:
+                chunks_by_path.setdefault(chunk.source_path, []).append(chunk)
+
+    # Load and split only the new or changed files
+    loaded, skipped = load_records(changed, workers=workers)
+    ignored += skipped
+    fingerprints = {record.relative_path: record for record in changed}
+    for doc in loaded:
+        record = fingerprints[doc.relative_path]
+        manifest[doc.relative_path] = ManifestEntry(
+            record.size_bytes, record.mtime_ns, doc.id
+        )
+    fresh = {doc.relative_path: doc for doc in loaded}
 
-    if not loaded:
+    # Keep the deterministic order of collect_files
+    loaded_paths = [
+        record.relative_path for record in records if record.relative_path in manifest
+    ]
+
+    if not loaded_paths:
         return IngestSummary(
-            discovered=discovered,
+            discovered=len(records),
             ignored=ignored,
             loaded=0,
             chunks=0,
             sample_paths=[],
         )
 
-    # Split into chunks
-    chunks = split_documents(loaded, chunk_size, chunk_overlap)
+    # Split new files in a process pool when there are enough of them. The
+    # pool forks its workers here, before build starts any threads.
+    fresh_chunks = iter_document_chunks(
+        [fresh[path] for path in loaded_paths if path in fresh],
+        chunk_size,
+        chunk_overlap,
+        max_workers=workers,
+    )
 
-    # Build and save index
-    index = VectorIndex(folder_path)
-    index.build(chunks, embedding_model)
+    def iter_chunks() -> Iterator[DocumentChunk]:
+        for path in loaded_paths:
+            if path in fresh:
+                yield from next(fresh_chunks)
+            else:
+                yield from chunks_by_path.get(path, [])
+
+    # Build and save index, splitting lazily as the embedder asks for chunks
+    try:
+        chunk_count = index.build(iter_chunks(), embedding_model)
+    finally:
+        # Stops the split pool if build failed before using every chunk
+        fresh_chunks.close()
     index.save()
-
-    sample_paths = [doc.relative_path for doc in loaded][:5]
+    write_manifest(
+        manifest_path,
+        {path: manifest[path] for path in loaded_paths},
+        chunk_size,
+        chunk_overlap,
+    )
 
     return IngestSummary(
-        discovered=discovered,
+        discovered=len(records),
         ignored=ignored,
-        loaded=len(loaded),
-        chunks=len(chunks),
-        sample_paths=sample_paths,
+        loaded=len(loaded_paths),
+        chunks=chunk_count,
+        sample_paths=loaded_paths[:5],
     )
 
 
@@ -229,6 +558,8 @@ def ingest_dry_run(
     folder_path: Path,
     sample_size: int = 5,
     ignore_patterns: Optional[List[str]] = None,
+    workers: Optional[int] = None,
+    use_pathspec: bool = False,
 ) -> IngestSummary:
     """Run ingestion in dry-run mode (no embedding, no index).
 
@@ -236,11 +567,16 @@ def ingest_dry_run(
         folder_path: Path to folder to analyze
         sample_size: Number of sample paths to return
         ignore_patterns: Additional patterns to ignore
+        workers: Number of worker processes, as for ingest_folder (a dry run
+            only loads files, it does not split them)
+        use_pathspec: Match ignore patterns with pathspec
 
     Returns:
         IngestSummary with statistics (chunks=0 in dry-run)
     """
-    loaded, discovered, ignored = load_folder(folder_path, ignore_patterns)
+    loaded, discovered, ignored = load_folder(
+        folder_path, ignore_patterns, workers=workers, use_pathspec=use_pathspec
+    )
     sample_paths = [doc.relative_path for doc in loaded][:sample_size]
 
     return IngestSummary(
@@ -1,14 +1,33 @@
 """File loading logic for Augustus."""
 
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-import hashlib
+import mmap
+import os
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
+
+import xxhash
 
 from augustus.config import MAX_FILE_SIZE_BYTES
 from augustus.utils.file_tree import FileRecord, collect_files
 from augustus.utils.ignore import build_ignore_spec
 
+# Below this many files, process start-up costs more than it saves
+PARALLEL_MIN_FILES = 64
+
+# Files handed to a worker at a time (amortises task overhead)
+LOAD_BATCH_SIZE = 32
+
+# Only the start of a file is sniffed for null bytes (as git and file(1) do)
+BINARY_SNIFF_BYTES = 8192
+
+# Files at least this large are memory-mapped instead of read into a bytes copy
+MMAP_MIN_BYTES = 64 * 1024
+
+# Name of the hash behind document ids (bump it whenever _stable_id changes)
+DOC_ID_SCHEME = "xxh3_128"
+
 
 @dataclass(frozen=True)
 class LoadedDocument:
@@ -20,58 +39,92 @@ class LoadedDocument:
     metadata: Dict[str, object]
 
 
-def _is_binary_bytes(raw: bytes) -> bool:
-    if b"\x00" in raw:
-        return True
-    return False
+def _is_binary_bytes(raw: Union[bytes, mmap.mmap]) -> bool:
+    return raw.find(b"\x00", 0, BINARY_SNIFF_BYTES) != -1
+
+
+def _stable_id(relative_path: str, raw: Union[bytes, mmap.mmap]) -> str:
+    # Hash the bytes as read; re-encoding the decoded text would copy the file.
+    # The id is a fingerprint, not a security boundary, so a fast
+    # non-cryptographic 128-bit hash is enough.
+    hasher = xxhash.xxh3_128()
+    hasher.update(relative_path.encode("utf-8"))
+    hasher.update(b"\n")
+    hasher.update(raw)
+    return hasher.hexdigest()
 
 
-def _stable_id(relative_path: str, content: str) -> str:
-    payload = f"{relative_path}\n{content}".encode("utf-8")
-    return hashlib.sha256(payload).hexdigest()
+def _decode_and_hash(
+    raw: Union[bytes, mmap.mmap],
+    relative_path: str,
+) -> Optional[Tuple[str, str]]:
+    """Return (content, doc_id) for text bytes, or None if binary or not UTF-8."""
+    if _is_binary_bytes(raw):
+        return None
+
+    try:
+        # str() decodes straight from the buffer, so an mmap is never copied
+        content = str(raw, "utf-8")
+    except UnicodeDecodeError:
+        return None
+
+    return content, _stable_id(relative_path, raw)
 
 
 def load_file(
     file_path: Path,
     base_path: Optional[Path] = None,
-    size_bytes: Optional[int] = None,
-    extension: Optional[str] = None,
+    *,
+    size_bytes: int,
+    extension: str,
+    relative_path: Optional[str] = None,
 ) -> Optional[LoadedDocument]:
-    """Load a single file as text if possible."""
-    try:
-        if size_bytes is None:
-            size_bytes = file_path.stat().st_size
-    except OSError:
-        return None
+    """Load a single file as text if possible.
 
-    if size_bytes > MAX_FILE_SIZE_BYTES:
-        return None
+    Size and extension come from the directory walk, so the file is
+    never stat-ed a second time here. They are keyword-only so that the
+    old load_file(path, base_path) call order cannot silently shift.
 
-    try:
-        raw = file_path.read_bytes()
-    except OSError:
-        return None
+    Args:
+        file_path: Absolute path to the file
+        base_path: Base directory for the relative path
+        size_bytes: File size from the walk
+        extension: Lowercased file extension from the walk
+        relative_path: Relative path from the walk; computed from base_path
+            when not given
 
-    if _is_binary_bytes(raw):
-        return None
-
-    try:
-        content = raw.decode("utf-8")
-    except UnicodeDecodeError:
+    Returns:
+        LoadedDocument, or None if the file is too large, binary or unreadable
+    """
+    if size_bytes > MAX_FILE_SIZE_BYTES:
         return None
 
-    if base_path is not None:
+    if relative_path is None and base_path is not None:
         try:
             relative_path = file_path.relative_to(base_path).as_posix()
         except ValueError:
             relative_path = file_path.name
-    else:
+    elif relative_path is None:
         relative_path = file_path.name
 
-    doc_id = _stable_id(relative_path, content)
+    try:
+        if size_bytes < MMAP_MIN_BYTES:
+            decoded = _decode_and_hash(file_path.read_bytes(), relative_path)
+        else:
+            with open(file_path, "rb") as handle:
+                with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    decoded = _decode_and_hash(mapped, relative_path)
+    except (OSError, ValueError):
+        # ValueError: the file was truncated to zero bytes before mapping
+        return None
+
+    if decoded is None:
+        return None
+
+    content, doc_id = decoded
     metadata = {
         "size_bytes": size_bytes,
-        "extension": extension if extension is not None else file_path.suffix.lower(),
+        "extension": extension,
     }
 
     return LoadedDocument(
@@ -82,29 +135,95 @@ def load_file(
     )
 
 
+def _load_file_worker(
+    args: Tuple[Path, str, int, str],
+) -> Optional[LoadedDocument]:
+    """Unpack a job tuple for load_file (top-level so it can be pickled)."""
+    file_path, relative_path, size_bytes, extension = args
+    return load_file(
+        file_path,
+        size_bytes=size_bytes,
+        extension=extension,
+        relative_path=relative_path,
+    )
+
+
+def _load_file_batch(
+    jobs: List[Tuple[Path, str, int, str]],
+) -> List[Optional[LoadedDocument]]:
+    """Load a batch of job tuples in order."""
+    return [_load_file_worker(job) for job in jobs]
+
+
+def load_records(
+    records: List[FileRecord],
+    workers: Optional[int] = None,
+) -> Tuple[List[LoadedDocument], int]:
+    """Load the given file records as text.
+
+    Files are loaded in a process pool when there are enough of them to
+    make it worthwhile; with one worker they are loaded serially. Results
+    keep the order of the records.
+
+    Args:
+        records: File records from collect_files
+        workers: Number of worker processes (None for CPU count)
+
+    Returns:
+        Tuple of (loaded_documents, skipped_count)
+
+    Raises:
+        ValueError: If workers is less than 1
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    elif workers < 1:
+        raise ValueError(f"workers must be at least 1, got {workers}")
+
+    # The walk's relative path is used as is. Recomputing it from the folder
+    # would fail when the folder is relative or reached through a symlink,
+    # because absolute_path is built from the resolved root.
+    jobs = [
+        (
+            record.absolute_path,
+            record.relative_path,
+            record.size_bytes,
+            record.extension,
+        )
+        for record in records
+    ]
+
+    if len(jobs) < PARALLEL_MIN_FILES or workers == 1:
+        results = _load_file_batch(jobs)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(
+                pool.map(_load_file_worker, jobs, chunksize=LOAD_BATCH_SIZE)
+            )
+
+    loaded = [doc for doc in results if doc is not None]
+    return loaded, len(results) - len(loaded)
+
+
 def load_folder(
     folder_path: Path,
     ignore_patterns: Optional[List[str]] = None,
+    workers: Optional[int] = None,
+    use_pathspec: bool = False,
 ) -> Tuple[List[LoadedDocument], int, int]:
     """Load all text files from a folder.
 
+    Args:
+        folder_path: Folder to load
+        ignore_patterns: Additional patterns to ignore
+        workers: Number of worker processes (None for CPU count)
+        use_pathspec: Match ignore patterns with pathspec
+
     Returns:
         Tuple of (loaded_documents, discovered_count, ignored_count)
     """
-    ignore_spec = build_ignore_spec(folder_path, ignore_patterns)
+    ignore_spec = build_ignore_spec(folder_path, ignore_patterns, use_pathspec)
     records, ignored_count = collect_files(folder_path, ignore_spec=ignore_spec)
+    loaded, skipped_count = load_records(records, workers=workers)
 
-    loaded: List[LoadedDocument] = []
-    for record in records:
-        doc = load_file(
-            record.absolute_path,
-            base_path=folder_path,
-            size_bytes=record.size_bytes,
-            extension=record.extension,
-        )
-        if doc is None:
-            ignored_count += 1
-            continue
-        loaded.append(doc)
-
-    return loaded, len(records), ignored_count
+    return loaded, len(records), ignored_count + skipped_count
@@ -0,0 +1,91 @@
+"""Ingest manifest for Augustus.
+
+The manifest records the size and modification time of every file that made
+it into the index, so a re-ingest can tell which files are unchanged without
+reading them.
+"""
+
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict
+
+from augustus.ingest.loader import DOC_ID_SCHEME
+
+# Manifest file name (stored inside the index directory)
+MANIFEST_FILE_NAME = "manifest.json"
+
+
+@dataclass(frozen=True)
+class ManifestEntry:
+    """Fingerprint of an indexed file."""
+
+    size_bytes: int
+    mtime_ns: int
+    doc_id: str
+
+
+def read_manifest(
+    manifest_path: Path,
+    chunk_size: int,
+    chunk_overlap: int,
+) -> Dict[str, ManifestEntry]:
+    """Read the manifest written by the previous ingest.
+
+    Chunks are only reusable if they were cut the same way and carry ids of
+    the current scheme, so a manifest written with other chunk settings or
+    another id scheme is treated as empty.
+
+    Args:
+        manifest_path: Path to the manifest file
+        chunk_size: Chunk size of the current ingest
+        chunk_overlap: Chunk overlap of the current ingest
+
+    Returns:
+        Mapping of relative path to entry (empty if missing or unusable)
+    """
+    try:
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+    settings = (
+        data.get("id_scheme"),
+        data.get("chunk_size"),
+        data.get("chunk_overlap"),
+    )
+    if settings != (DOC_ID_SCHEME, chunk_size, chunk_overlap):
+        return {}
+
+    return {
+        relative_path: ManifestEntry(size_bytes, mtime_ns, doc_id)
+        for relative_path, (size_bytes, mtime_ns, doc_id) in data["files"].items()
+    }
+
+
+def write_manifest(
+    manifest_path: Path,
+    entries: Dict[str, ManifestEntry],
+    chunk_size: int,
+    chunk_overlap: int,
+) -> None:
+    """Write the manifest for the current ingest.
+
+    Args:
+        manifest_path: Path to the manifest file
+        entries: Mapping of relative path to entry
+        chunk_size: Chunk size used for this ingest
+        chunk_overlap: Chunk overlap used for this ingest
+    """
+    data = {
+        "id_scheme": DOC_ID_SCHEME,
+        "chunk_size": chunk_size,
+        "chunk_overlap": chunk_overlap,
+        "files": {
+            relative_path: [entry.size_bytes, entry.mtime_ns, entry.doc_id]
+            for relative_path, entry in entries.items()
+        },
+    }
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
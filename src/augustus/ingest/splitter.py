@@ -4,14 +4,39 @@ This module handles splitting documents into chunks for embedding.
 Uses LangChain text splitters for consistent, deterministic chunking.
 """
 
+import functools
+import itertools
+import os
+from collections import ChainMap, deque
+from concurrent.futures import Future, ProcessPoolExecutor
 from dataclasses import dataclass
-from typing import List
-
-from langchain_text_splitters import RecursiveCharacterTextSplitter
+from typing import (
+    TYPE_CHECKING,
+    Deque,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+)
 
 from augustus.config import DEFAULT_CHUNK_OVERLAP, DEFAULT_CHUNK_SIZE
 from augustus.ingest.loader import LoadedDocument
 
+if TYPE_CHECKING:
+    from langchain_text_splitters import RecursiveCharacterTextSplitter
+
+# Below this many documents, process start-up costs more than it saves
+PARALLEL_SPLIT_MIN_DOCS = 64
+
+# Documents handed to a split worker at a time
+SPLIT_BATCH_SIZE = 8
+
+# Batches in flight per worker; bounds the split chunks waiting to be consumed
+SPLIT_BATCHES_PER_WORKER = 4
+
 
 @dataclass(frozen=True)
 class DocumentChunk:
@@ -21,14 +46,19 @@ class DocumentChunk:
     content: str
     source_path: str
     chunk_index: int
-    metadata: dict
+    metadata: Mapping[str, object]
 
 
 def create_splitter(
     chunk_size: int = DEFAULT_CHUNK_SIZE,
     chunk_overlap: int = DEFAULT_CHUNK_OVERLAP,
-) -> RecursiveCharacterTextSplitter:
-    """Create a text splitter with the given parameters.
+) -> "RecursiveCharacterTextSplitter":
+    """Return a text splitter with the given parameters.
+
+    Splitters are cached per (chunk_size, chunk_overlap), so splitting a
+    whole corpus builds one splitter instead of one per document. The
+    splitter only holds its configuration, so sharing it is safe; do not
+    mutate the returned object.
 
     Args:
         chunk_size: Target size for each chunk in characters
@@ -37,6 +67,17 @@ def create_splitter(
     Returns:
         Configured RecursiveCharacterTextSplitter
     """
+    # Positional call, so defaults and explicit values share one cache entry
+    return _cached_splitter(chunk_size, chunk_overlap)
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_splitter(
+    chunk_size: int, chunk_overlap: int
+) -> "RecursiveCharacterTextSplitter":
+    # Imported on first use so importing this module does not load LangChain
+    from langchain_text_splitters import RecursiveCharacterTextSplitter
+
     return RecursiveCharacterTextSplitter(
         chunk_size=chunk_size,
         chunk_overlap=chunk_overlap,
@@ -46,10 +87,61 @@ def create_splitter(
     )
 
 
+def _merge_small_chunks(
+    text: str,
+    text_chunks: List[str],
+    min_chunk_size: int,
+    chunk_size: int,
+    chunk_overlap: int,
+) -> List[str]:
+    """Merge chunks shorter than min_chunk_size into their neighbours.
+
+    Chunks are located in the source text and merged as the span covering
+    both, so overlapping text is not repeated and the original separators
+    are kept. A merge never produces a chunk longer than chunk_size.
+
+    Args:
+        text: Text the chunks were split from
+        text_chunks: Chunks in order
+        min_chunk_size: Chunks shorter than this are merged when possible
+        chunk_size: Maximum size of a merged chunk
+        chunk_overlap: Overlap used when splitting
+
+    Returns:
+        List of text chunks
+    """
+    spans: List[Tuple[int, int]] = []
+    search_from = 0
+    prev_end = 0
+    for chunk in text_chunks:
+        # A chunk reaches back into the previous one by at most the overlap,
+        # and always ends past it (skip repeats inside the previous chunk)
+        start = text.find(chunk, search_from)
+        while start != -1 and start + len(chunk) <= prev_end:
+            start = text.find(chunk, start + 1)
+        if start == -1:
+            return text_chunks
+        prev_end = start + len(chunk)
+        spans.append((start, prev_end))
+        search_from = max(start + 1, prev_end - chunk_overlap)
+
+    merged = spans[:1]
+    for start, end in spans[1:]:
+        prev_start, prev_end = merged[-1]
+        small = min(prev_end - prev_start, end - start) < min_chunk_size
+        if small and end - prev_start <= chunk_size:
+            merged[-1] = (prev_start, end)
+        else:
+            merged.append((start, end))
+
+    return [text[start:end] for start, end in merged]
+
+
 def split_document(
     document: LoadedDocument,
     chunk_size: int = DEFAULT_CHUNK_SIZE,
     chunk_overlap: int = DEFAULT_CHUNK_OVERLAP,
+    min_chunk_size: int = 0,
 ) -> List[DocumentChunk]:
     """Split a single document into chunks.
 
@@ -57,13 +149,19 @@ def split_document(
         document: The loaded document to split
         chunk_size: Target size for each chunk in characters
         chunk_overlap: Number of characters to overlap between chunks
+        min_chunk_size: Merge chunks shorter than this into a neighbour
+            (0 disables merging)
 
     Returns:
         List of DocumentChunk objects
     """
-    splitter = create_splitter(chunk_size, chunk_overlap)
-    text_chunks = splitter.split_text(document.content)
+    text_chunks = split_text(
+        document.content, chunk_size, chunk_overlap, min_chunk_size
+    )
 
+    # Every chunk shares the document's metadata dict behind its own small
+    # overlay; writes to a chunk's metadata land in the overlay only
+    total_chunks = len(text_chunks)
     chunks = []
     for i, text in enumerate(text_chunks):
         chunk_id = f"{document.id}_{i}"
@@ -73,22 +171,125 @@ def split_document(
                 content=text,
                 source_path=document.relative_path,
                 chunk_index=i,
-                metadata={
-                    **document.metadata,
-                    "source": document.relative_path,
-                    "chunk_index": i,
-                    "total_chunks": len(text_chunks),
-                },
+                metadata=ChainMap(
+                    {
+                        "source": document.relative_path,
+                        "chunk_index": i,
+                        "total_chunks": total_chunks,
+                    },
+                    document.metadata,
+                ),
             )
         )
 
     return chunks
 
 
+def iter_split_documents(
+    documents: Iterable[LoadedDocument],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    chunk_overlap: int = DEFAULT_CHUNK_OVERLAP,
+) -> Iterator[DocumentChunk]:
+    """Yield chunks document by document, without building a full list.
+
+    Args:
+        documents: Loaded documents
+        chunk_size: Target size for each chunk in characters
+        chunk_overlap: Number of characters to overlap between chunks
+
+    Yields:
+        DocumentChunk objects in document order
+    """
+    for doc in documents:
+        yield from split_document(doc, chunk_size, chunk_overlap)
+
+
+def _split_batch(
+    documents: List[LoadedDocument],
+    chunk_size: int,
+    chunk_overlap: int,
+) -> List[List[DocumentChunk]]:
+    """Split a batch of documents (top-level so it can be pickled)."""
+    return [
+        split_document(document, chunk_size, chunk_overlap) for document in documents
+    ]
+
+
+def _iter_pooled(
+    pool: ProcessPoolExecutor,
+    pending: Deque["Future[List[List[DocumentChunk]]]"],
+    batches: Iterator[List[LoadedDocument]],
+    chunk_size: int,
+    chunk_overlap: int,
+) -> Generator[List[DocumentChunk], None, None]:
+    """Yield split batches in order, submitting one new batch per batch taken."""
+    try:
+        while pending:
+            ready = pending.popleft()
+            batch = next(batches, None)
+            if batch is not None:
+                pending.append(
+                    pool.submit(_split_batch, batch, chunk_size, chunk_overlap)
+                )
+            yield from ready.result()
+    finally:
+        pool.shutdown(cancel_futures=True)
+
+
+def iter_document_chunks(
+    documents: List[LoadedDocument],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    chunk_overlap: int = DEFAULT_CHUNK_OVERLAP,
+    max_workers: Optional[int] = None,
+) -> Generator[List[DocumentChunk], None, None]:
+    """Yield the chunks of each document, one list per document.
+
+    Splitting is CPU-bound Python, so large batches are split in a process
+    pool. Lists are yielded in the order of the input documents as soon as
+    they are ready, so callers can start embedding before all are split.
+    Only a few batches per worker are in flight at a time, so a slow
+    consumer does not pile up split chunks.
+
+    The pool's processes are started before this returns, so callers
+    can start threads afterwards without forking a threaded process.
+    Close the iterator if it is not run to the end, to stop the pool.
+
+    Args:
+        documents: List of loaded documents
+        chunk_size: Target size for each chunk in characters
+        chunk_overlap: Number of characters to overlap between chunks
+        max_workers: Number of worker processes (None for CPU count)
+
+    Returns:
+        Generator of the DocumentChunk list of each document
+    """
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+
+    if max_workers <= 1 or len(documents) < PARALLEL_SPLIT_MIN_DOCS:
+        return (
+            split_document(document, chunk_size, chunk_overlap)
+            for document in documents
+        )
+
+    batches = (
+        documents[i : i + SPLIT_BATCH_SIZE]
+        for i in range(0, len(documents), SPLIT_BATCH_SIZE)
+    )
+    pool = ProcessPoolExecutor(max_workers=max_workers)
+    # Submitting the first window here forks the workers right away
+    pending: Deque["Future[List[List[DocumentChunk]]]"] = deque(
+        pool.submit(_split_batch, batch, chunk_size, chunk_overlap)
+        for batch in itertools.islice(batches, SPLIT_BATCHES_PER_WORKER * max_workers)
+    )
+    return _iter_pooled(pool, pending, batches, chunk_size, chunk_overlap)
+
+
 def split_documents(
     documents: List[LoadedDocument],
     chunk_size: int = DEFAULT_CHUNK_SIZE,
     chunk_overlap: int = DEFAULT_CHUNK_OVERLAP,
+    max_workers: Optional[int] = None,
 ) -> List[DocumentChunk]:
     """Split multiple documents into chunks.
 
@@ -96,32 +297,82 @@ def split_documents(
         documents: List of loaded documents
         chunk_size: Target size for each chunk in characters
         chunk_overlap: Number of characters to overlap between chunks
+        max_workers: Number of worker processes (None for CPU count)
 
     Returns:
         List of DocumentChunk objects from all documents
     """
-    all_chunks = []
-    for doc in documents:
-        chunks = split_document(doc, chunk_size, chunk_overlap)
-        all_chunks.extend(chunks)
-
-    return all_chunks
+    return [
+        chunk
+        for chunks in iter_document_chunks(
+            documents, chunk_size, chunk_overlap, max_workers
+        )
+        for chunk in chunks
+    ]
 
 
 def split_text(
     text: str,
     chunk_size: int = DEFAULT_CHUNK_SIZE,
     chunk_overlap: int = DEFAULT_CHUNK_OVERLAP,
+    min_chunk_size: int = 0,
 ) -> List[str]:
     """Split a single text into chunks.
 
+    Tiny chunks (a stray heading, a closing brace) carry little meaning but
+    cost an embedding each. Set min_chunk_size to merge them into a
+    neighbour, as long as the result stays within chunk_size.
+
     Args:
         text: Text to split
         chunk_size: Target size for each chunk in characters
         chunk_overlap: Number of characters to overlap between chunks
+        min_chunk_size: Merge chunks shorter than this into a neighbour
+            (0 disables merging)
 
     Returns:
         List of text chunks
     """
     splitter = create_splitter(chunk_size, chunk_overlap)
-    return splitter.split_text(text)
+    text_chunks = splitter.split_text(text)
+    if min_chunk_size > 0 and len(text_chunks) > 1:
+        text_chunks = _merge_small_chunks(
+            text, text_chunks, min_chunk_size, chunk_size, chunk_overlap
+        )
+    return text_chunks
+
+
+def split_text_sliding(
+    text: str,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    chunk_overlap: int = DEFAULT_CHUNK_OVERLAP,
+) -> List[str]:
+    """Split text into fixed-size windows by character offset.
+
+    No separators are searched, so this is much faster than split_text on
+    large inputs, but chunks may end mid-word. Prefer it for text with no
+    useful structure (logs, data dumps, minified files).
+
+    Args:
+        text: Text to split
+        chunk_size: Size of each chunk in characters
+        chunk_overlap: Number of characters to overlap between chunks
+
+    Returns:
+        List of text chunks
+
+    Raises:
+        ValueError: If chunk_overlap is not smaller than chunk_size
+    """
+    if chunk_overlap >= chunk_size:
+        raise ValueError(
+            f"chunk_overlap ({chunk_overlap}) must be smaller than "
+            f"chunk_size ({chunk_size})"
+        )
+
+    if not text:
+        return []
+
+    step = chunk_size - chunk_overlap
+    last_start = max(len(text) - chunk_overlap, 1)
+    return [text[start : start + chunk_size] for start in range(0, last_start, step)]
@@ -47,13 +47,15 @@ def format_answer(
     if not include_citations or not citations:
         return answer
     
-    # Format citations
-    formatted = f"{answer}\n\nSources:\n"
-    for i, citation in enumerate(citations, 1):
-        source = citation.get('source', 'unknown')
-        formatted += f"{i}. {source}\n"
+    # Format citations (collected in a list; += would copy the text each time)
+    lines = [answer, "", "Sources:"]
+    lines.extend(
+        f"{i}. {citation.get('source', 'unknown')}"
+        for i, citation in enumerate(citations, 1)
+    )
+    lines.append("")
     
-    return formatted
+    return "\n".join(lines)
 
 
 def extract_citations(
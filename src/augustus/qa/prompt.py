@@ -4,15 +4,22 @@ This module defines prompt templates for the QA pipeline.
 Future implementation will use LangChain prompt templates.
 """
 
-from typing import List
+from typing import List, Optional
 
 
-def build_qa_prompt(query: str, context_chunks: List[dict]) -> str:
+def build_qa_prompt(
+    query: str,
+    context_chunks: List[dict],
+    max_context_chars: Optional[int] = None,
+) -> str:
     """Build a QA prompt from query and context.
     
     Args:
         query: The user's question
         context_chunks: List of retrieved chunks with content and metadata
+        max_context_chars: Maximum length of the context section. Chunks are
+            taken in order and the first one that does not fit ends it
+            (None for no limit).
         
     Returns:
         Formatted prompt string
@@ -20,24 +27,28 @@ def build_qa_prompt(query: str, context_chunks: List[dict]) -> str:
     Note:
         This is a placeholder. Future implementation will use proper templates.
     """
-    # Placeholder template
-    template = """Answer the following question using only the provided context.
+    # Format context from chunks, stopping once the budget is used up
+    blocks = []
+    total = 0
+    for chunk in context_chunks:
+        block = f"[{chunk.get('source', 'unknown')}]\n{chunk.get('content', '')}"
+        if max_context_chars is not None:
+            total += len(block) + (2 if blocks else 0)
+            if total > max_context_chars:
+                break
+        blocks.append(block)
+    context = "\n\n".join(blocks)
+    
+    # Placeholder template (an f-string, so it is not re-parsed per call)
+    return f"""Answer the following question using only the provided context.
 If the answer is not present in the context, explicitly say "I don't know based on the files."
 
 Context:
 {context}
 
-Question: {question}
+Question: {query}
 
 Answer:"""
-    
-    # Format context from chunks
-    context = "\n\n".join([
-        f"[{chunk.get('source', 'unknown')}]\n{chunk.get('content', '')}"
-        for chunk in context_chunks
-    ])
-    
-    return template.format(context=context, question=query)
 
 
 def build_system_prompt() -> str:
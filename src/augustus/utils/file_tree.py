@@ -4,11 +4,13 @@ This module generates readable file tree representations.
 No LangChain dependencies - pure Python only.
 """
 
+import os
+import sys
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import List, Optional, Tuple, Union
 
-from augustus.utils.ignore import IgnoreSpec, build_ignore_spec, should_ignore
+from augustus.utils.ignore import IgnoreSpec, build_ignore_spec, spec_for_patterns
 
 
 @dataclass(frozen=True)
@@ -19,12 +21,14 @@ class FileRecord:
     relative_path: str
     size_bytes: int
     extension: str
+    mtime_ns: int
 
 
 def generate_tree(
     root_path: Path,
     ignore_patterns: Optional[List[str]] = None,
     max_depth: Optional[int] = None,
+    use_pathspec: bool = False,
 ) -> str:
     """Generate a text-based file tree representation.
     
@@ -32,6 +36,7 @@ def generate_tree(
         root_path: Root directory path
         ignore_patterns: List of patterns to ignore (gitignore-style)
         max_depth: Maximum depth to traverse (None for unlimited)
+        use_pathspec: Match with pathspec instead of the built-in matcher
         
     Returns:
         String representation of the file tree
@@ -43,108 +48,102 @@ def generate_tree(
         return f"Not a directory: {root_path}"
     
     lines = [str(root_path.name) + "/"]
-    _build_tree(root_path, "", lines, ignore_patterns or [], max_depth, 0)
+    ignore_spec = spec_for_patterns(ignore_patterns, use_pathspec)
+    _build_tree(root_path, "", lines, ignore_spec, max_depth, 0)
     return "\n".join(lines)
 
 
+def _scan_sorted(path: Union[Path, str]) -> Optional[List[os.DirEntry]]:
+    """List a directory with scandir, directories first, then by name.
+
+    DirEntry caches the file type from the directory read, so sorting and
+    the later is_dir() checks do not stat each entry again.
+
+    Returns:
+        Sorted entries, or None if the directory cannot be read
+    """
+    try:
+        with os.scandir(path) as iterator:
+            entries = list(iterator)
+    except PermissionError:
+        return None
+    entries.sort(key=lambda entry: (not entry.is_dir(), entry.name))
+    return entries
+
+
 def _build_tree(
     path: Path,
     prefix: str,
     lines: List[str],
-    ignore_patterns: List[str],
+    ignore_spec: IgnoreSpec,
     max_depth: Optional[int],
     current_depth: int,
 ) -> None:
-    """Recursively build the tree structure.
+    """Build the tree structure depth-first with an explicit stack.
     
     Args:
         path: Current directory path
         prefix: Prefix for tree formatting
         lines: List to accumulate output lines
-        ignore_patterns: Patterns to ignore
+        ignore_spec: Compiled ignore patterns
         max_depth: Maximum depth
-        current_depth: Current recursion depth
+        current_depth: Current depth
     """
-    if max_depth is not None and current_depth >= max_depth:
-        return
-    
-    try:
-        entries = sorted(path.iterdir(), key=lambda p: (not p.is_dir(), p.name))
-    except PermissionError:
-        return
-    
-    for i, entry in enumerate(entries):
-        is_last = i == len(entries) - 1
-        
-        # Skip ignored patterns (simplified check)
-        if _should_ignore(entry, ignore_patterns):
+    # Each item is (entry, prefix, is_last, depth of the listing it came from,
+    # relative path of that listing with a trailing "/", or "" at the top)
+    stack: List[Tuple[os.DirEntry, str, bool, int, str]] = []
+
+    def push_children(
+        directory: Union[Path, str], prefix: str, depth: int, rel_dir: str
+    ) -> None:
+        if max_depth is not None and depth >= max_depth:
+            return
+        entries = _scan_sorted(directory)
+        if not entries:
+            return
+        last = len(entries) - 1
+        for i in range(last, -1, -1):
+            stack.append((entries[i], prefix, i == last, depth, rel_dir))
+
+    push_children(path, prefix, current_depth, "")
+
+    while stack:
+        entry, prefix, is_last, depth, rel_dir = stack.pop()
+
+        is_dir = entry.is_dir()
+        rel_path = rel_dir + entry.name
+        if ignore_spec.should_ignore_fast(entry.name, rel_path, is_dir):
             continue
-        
+
         # Format tree branch
         connector = "└── " if is_last else "├── "
-        name = entry.name + ("/" if entry.is_dir() else "")
+        name = entry.name + ("/" if is_dir else "")
         lines.append(f"{prefix}{connector}{name}")
-        
-        # Recurse into directories
-        if entry.is_dir():
+
+        # Descend into directories
+        if is_dir:
             extension = "    " if is_last else "│   "
-            _build_tree(
-                entry,
-                prefix + extension,
-                lines,
-                ignore_patterns,
-                max_depth,
-                current_depth + 1,
+            push_children(
+                entry.path, prefix + extension, depth + 1, rel_path + "/"
             )
 
 
-def _should_ignore(path: Path, ignore_patterns: List[str]) -> bool:
-    """Check if a path should be ignored based on patterns.
-    
-    Args:
-        path: Path to check
-        ignore_patterns: List of patterns
-        
-    Returns:
-        True if path should be ignored
-        
-    Note:
-        This is a simplified implementation. Future version may use gitignore-style matching.
-    """
-    name = path.name
-    
-    # Check exact matches and simple patterns
-    for pattern in ignore_patterns:
-        pattern = pattern.rstrip("/")
-        
-        # Exact match
-        if name == pattern:
-            return True
-        
-        # Directory match
-        if pattern.endswith("/") and path.is_dir() and name == pattern[:-1]:
-            return True
-        
-        # Wildcard patterns (simplified)
-        if "*" in pattern:
-            import fnmatch
-            if fnmatch.fnmatch(name, pattern):
-                return True
-    
-    return False
-
-
 def collect_files(
     root_path: Path,
     ignore_spec: Optional[IgnoreSpec] = None,
     extra_ignore_patterns: Optional[List[str]] = None,
+    resolve_symlinks: bool = False,
 ) -> Tuple[List[FileRecord], int]:
     """Collect file records under a root path.
 
+    Absolute paths are the resolved root joined with the relative path,
+    so no per-file realpath is needed.
+
     Args:
         root_path: Root directory path
         ignore_spec: Optional ignore spec to reuse
         extra_ignore_patterns: Additional ignore patterns to apply
+        resolve_symlinks: Resolve each file path to its symlink target
 
     Returns:
         Tuple of (file_records, ignored_count)
@@ -155,48 +154,56 @@ def collect_files(
     if ignore_spec is None:
         ignore_spec = build_ignore_spec(root_path, extra_ignore_patterns)
 
+    root_abs = root_path.resolve()
     records: List[FileRecord] = []
     ignored_count = 0
-    stack = [root_path]
+    # Each item is (directory, its relative path with a trailing "/")
+    stack: List[Tuple[str, str]] = [(str(root_path), "")]
 
     while stack:
-        current = stack.pop()
+        current, rel_dir = stack.pop()
         try:
-            entries = sorted(current.iterdir(), key=lambda p: p.name)
+            with os.scandir(current) as iterator:
+                entries = sorted(iterator, key=lambda entry: entry.name)
         except PermissionError:
             ignored_count += 1
             continue
 
-        dirs: List[Path] = []
+        dirs: List[Tuple[str, str]] = []
         for entry in entries:
-            if should_ignore(entry, base_path=root_path, ignore_spec=ignore_spec):
+            rel_path = rel_dir + entry.name
+            # DirEntry answers these from the directory read (no stat needed)
+            is_dir = entry.is_dir()
+            if ignore_spec.should_ignore_fast(entry.name, rel_path, is_dir):
                 ignored_count += 1
                 continue
 
-            if entry.is_dir():
-                dirs.append(entry)
+            if is_dir:
+                dirs.append((entry.path, rel_path + "/"))
                 continue
 
             if not entry.is_file():
                 continue
 
+            # DirEntry caches this stat. It follows symlinks on purpose: the
+            # loader reads the target, so size limits must see its size.
             try:
-                size_bytes = entry.stat().st_size
+                stat = entry.stat()
             except OSError:
                 ignored_count += 1
                 continue
 
-            try:
-                rel_path = entry.relative_to(root_path).as_posix()
-            except ValueError:
-                rel_path = entry.name
-
+            path = Path(entry.path)
             records.append(
                 FileRecord(
-                    absolute_path=entry.resolve(),
+                    absolute_path=(
+                        path.resolve() if resolve_symlinks else root_abs / rel_path
+                    ),
                     relative_path=rel_path,
-                    size_bytes=size_bytes,
-                    extension=entry.suffix.lower(),
+                    size_bytes=stat.st_size,
+                    # A handful of distinct values across thousands of records
+                    extension=sys.intern(path.suffix.lower()),
+                    mtime_ns=stat.st_mtime_ns,
                 )
             )
 
@@ -224,12 +231,14 @@ def list_files(
 def count_files(
     root_path: Path,
     ignore_patterns: Optional[List[str]] = None,
+    use_pathspec: bool = False,
 ) -> tuple[int, int]:
     """Count files and directories in a tree.
     
     Args:
         root_path: Root directory path
         ignore_patterns: List of patterns to ignore
+        use_pathspec: Match with pathspec instead of the built-in matcher
         
     Returns:
         Tuple of (file_count, directory_count)
@@ -239,18 +248,31 @@ def count_files(
     
     file_count = 0
     dir_count = 0
-    ignore_patterns = ignore_patterns or []
+    ignore_spec = spec_for_patterns(ignore_patterns, use_pathspec)
+    # Each item is (directory, its relative path with a trailing "/")
+    stack = [(str(root_path), "")]
     
-    try:
-        for entry in root_path.rglob("*"):
-            if _should_ignore(entry, ignore_patterns):
+    while stack:
+        current, rel_dir = stack.pop()
+        try:
+            with os.scandir(current) as iterator:
+                entries = list(iterator)
+        except PermissionError:
+            continue
+        
+        for entry in entries:
+            # Ignored directories are not entered, so their contents cost nothing
+            is_dir = entry.is_dir()
+            rel_path = rel_dir + entry.name
+            if ignore_spec.should_ignore_fast(entry.name, rel_path, is_dir):
                 continue
             
-            if entry.is_file():
-                file_count += 1
-            elif entry.is_dir():
+            if is_dir:
                 dir_count += 1
-    except PermissionError:
-        pass
+                # Like rglob, count symlinked directories but do not descend
+                if not entry.is_symlink():
+                    stack.append((entry.path, rel_path + "/"))
+            elif entry.is_file():
+                file_count += 1
     
     return file_count, dir_count
@@ -4,8 +4,15 @@ This module provides helpers for formatting CLI output.
 No LangChain dependencies - pure Python only.
 """
 
+import functools
+import itertools
+import textwrap
 from typing import List, Optional
 
+# Default truncate() suffix and its length
+_DEFAULT_SUFFIX = "..."
+_DEFAULT_SUFFIX_LEN = len(_DEFAULT_SUFFIX)
+
 
 def format_header(text: str, width: int = 80) -> str:
     """Format a header with borders.
@@ -110,29 +117,23 @@ def format_table(
     if not headers or not rows:
         return ""
     
-    # Calculate column widths if not provided
+    # Calculate column widths if not provided (one pass down each column;
+    # short rows are padded so they do not cut the other columns off)
     if column_widths is None:
-        column_widths = []
-        for i, header in enumerate(headers):
-            max_width = len(header)
-            for row in rows:
-                if i < len(row):
-                    max_width = max(max_width, len(row[i]))
-            column_widths.append(max_width + 2)
+        columns = itertools.zip_longest(headers, *rows, fillvalue="")
+        column_widths = [
+            max(map(len, column)) + 2
+            for column in itertools.islice(columns, len(headers))
+        ]
     
     # Format header
-    header_line = "".join(
-        f"{h:<{w}}" for h, w in zip(headers, column_widths)
-    )
+    header_line = "".join(h.ljust(w) for h, w in zip(headers, column_widths))
     separator = "-" * sum(column_widths)
     
     # Format rows
-    row_lines = []
-    for row in rows:
-        row_line = "".join(
-            f"{v:<{w}}" for v, w in zip(row, column_widths)
-        )
-        row_lines.append(row_line)
+    row_lines = [
+        "".join(v.ljust(w) for v, w in zip(row, column_widths)) for row in rows
+    ]
     
     return f"{header_line}\n{separator}\n" + "\n".join(row_lines)
 
@@ -148,17 +149,18 @@ def wrap_text(text: str, width: int = 80, indent: int = 0) -> str:
     Returns:
         Wrapped text string
     """
-    import textwrap
-    
-    wrapper = textwrap.TextWrapper(
+    return _text_wrapper(width, indent).fill(text)
+
+
+@functools.lru_cache(maxsize=16)
+def _text_wrapper(width: int, indent: int) -> textwrap.TextWrapper:
+    return textwrap.TextWrapper(
         width=width,
         subsequent_indent=" " * indent,
     )
-    
-    return wrapper.fill(text)
 
 
-def truncate(text: str, max_length: int, suffix: str = "...") -> str:
+def truncate(text: str, max_length: int, suffix: str = _DEFAULT_SUFFIX) -> str:
     """Truncate text to a maximum length.
     
     Args:
@@ -172,4 +174,6 @@ def truncate(text: str, max_length: int, suffix: str = "...") -> str:
     if len(text) <= max_length:
         return text
     
+    if suffix is _DEFAULT_SUFFIX:
+        return text[:max_length - _DEFAULT_SUFFIX_LEN] + suffix
     return text[:max_length - len(suffix)] + suffix
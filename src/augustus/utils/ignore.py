@@ -5,40 +5,286 @@ No LangChain dependencies - pure Python only.
 """
 
 import fnmatch
+import functools
+import os
+import re
+import stat
+import sys
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Pattern, Set, Tuple
 
 from augustus.config import DEFAULT_IGNORE_PATTERNS
 
+try:
+    # Optional: full gitignore semantics (pip install "augustus[gitignore]")
+    import pathspec
+except ImportError:
+    pathspec = None
+
+# Maximum number of (path, is_dir) results kept by IgnoreSpec
+_MATCH_CACHE_SIZE = 10000
+
+# Parsed .gitignore files: path -> (mtime_ns, size, patterns)
+_GITIGNORE_CACHE: Dict[str, Tuple[int, int, List[str]]] = {}
+
+# "*.ext" patterns, matched with str.endswith instead of a regex
+_SUFFIX_PATTERN = re.compile(r"\*\.[A-Za-z0-9_]+")
+
+
+def _fuse_regexes(regexes: List[str]) -> Optional[Pattern[str]]:
+    """Compile full-match regexes into one alternation (None if empty)."""
+    if not regexes:
+        return None
+    return re.compile("|".join(f"(?:{regex})" for regex in regexes))
+
+
+class _PatternGroup:
+    """Consecutive patterns that share one verdict (ignore or re-include).
+
+    Patterns without a "/" are matched against the file name: literal names
+    through a set lookup, "*.ext" patterns through one str.endswith call,
+    other wildcards through one fused regex (plus a set and a regex for
+    directory-only patterns). Patterns with a "/" are matched against the
+    relative path: anchored literals ("/build") by equality or prefix, other
+    literals as substrings, wildcards through one fused regex (and one for
+    directory-only patterns).
+    """
+
+    def __init__(self, ignore: bool, patterns: List[str]):
+        """Compile a run of patterns.
+
+        Args:
+            ignore: True for ignore patterns, False for "!" re-includes
+            patterns: Patterns with any "!" already removed
+        """
+        self.ignore = ignore
+
+        literal_names: Set[str] = set()
+        suffixes: Set[str] = set()
+        dir_literal_names: Set[str] = set()
+        name_regexes: List[str] = []
+        dir_name_regexes: List[str] = []
+        anchored_paths: Set[str] = set()
+        dir_anchored_paths: Set[str] = set()
+        literal_paths: List[str] = []
+        dir_literal_paths: List[str] = []
+        path_regexes: List[str] = []
+        dir_path_regexes: List[str] = []
+
+        for pattern in patterns:
+            # Directory-specific patterns
+            dir_only = pattern.endswith("/")
+            if dir_only:
+                pattern = pattern[:-1]
+
+            # A leading "/" anchors the pattern to the base directory
+            anchored = pattern.startswith("/")
+            if anchored:
+                pattern = pattern[1:]
+
+            # Skip empty patterns
+            if not pattern:
+                continue
+
+            is_wildcard = any(char in pattern for char in "*?[")
+
+            # Anchored literals are compared with the whole relative path
+            if anchored and not is_wildcard:
+                (dir_anchored_paths if dir_only else anchored_paths).add(pattern)
+                continue
+
+            # Patterns with a slash are matched against the relative path
+            if anchored or "/" in pattern:
+                if is_wildcard:
+                    regex = fnmatch.translate(pattern)
+                    (dir_path_regexes if dir_only else path_regexes).append(regex)
+                else:
+                    (dir_literal_paths if dir_only else literal_paths).append(pattern)
+                continue
+
+            if not is_wildcard:
+                (dir_literal_names if dir_only else literal_names).add(pattern)
+            elif not dir_only and _SUFFIX_PATTERN.fullmatch(pattern):
+                suffixes.add(pattern[1:])
+            elif dir_only:
+                dir_name_regexes.append(fnmatch.translate(pattern))
+            else:
+                name_regexes.append(fnmatch.translate(pattern))
+
+        self._literal_names = frozenset(literal_names)
+        self._dir_literal_names = frozenset(dir_literal_names)
+        self._suffixes = tuple(sorted(suffixes))
+        self._name_re = _fuse_regexes(name_regexes)
+        self._dir_name_re = _fuse_regexes(dir_name_regexes)
+        self._anchored_paths = frozenset(anchored_paths)
+        self._dir_anchored_paths = frozenset(dir_anchored_paths)
+        self._anchored_prefixes = tuple(
+            sorted(path + "/" for path in anchored_paths | dir_anchored_paths)
+        )
+        self._literal_paths = tuple(literal_paths)
+        self._dir_literal_paths = tuple(dir_literal_paths)
+        self._path_re = _fuse_regexes(path_regexes)
+        self._dir_path_re = _fuse_regexes(dir_path_regexes)
+
+    def match_name(self, name: str) -> bool:
+        """Match literal names, suffixes and wildcard name patterns."""
+        if name in self._literal_names or name.endswith(self._suffixes):
+            return True
+        return self._name_re is not None and self._name_re.match(name) is not None
+
+    def match_path(self, name: str, path_str: str, is_dir: bool) -> bool:
+        """Match directory-only name patterns and path patterns."""
+        if is_dir:
+            if name in self._dir_literal_names:
+                return True
+            if self._dir_name_re is not None and self._dir_name_re.match(name):
+                return True
+
+        # Anchored literals match the path itself or anything below it
+        if path_str in self._anchored_paths:
+            return True
+        if is_dir and path_str in self._dir_anchored_paths:
+            return True
+        if path_str.startswith(self._anchored_prefixes):
+            return True
+
+        # Literal path patterns match anywhere in the path
+        if any(literal in path_str for literal in self._literal_paths):
+            return True
+        if self._path_re is not None and self._path_re.match(path_str):
+            return True
+        if is_dir:
+            if any(literal in path_str for literal in self._dir_literal_paths):
+                return True
+            if self._dir_path_re is not None and self._dir_path_re.match(path_str):
+                return True
+
+        return False
+
 
 class IgnoreSpec:
     """Handles gitignore-style ignore patterns.
     
-    This is a simplified implementation. Future versions may use
-    a library like pathspec for full gitignore compatibility.
+    The built-in matcher is a simplified implementation and the default
+    everywhere, so a folder matches the same files on every machine. With
+    use_pathspec=True the patterns are handed to the optional pathspec
+    package instead, which follows gitignore semantics exactly. The two
+    disagree on some path patterns:
+
+    - A literal path ("docs/tmp") matches anywhere in the path under the
+      built-in matcher ("x/docs/tmp", even "mydocs/tmpx"); pathspec anchors
+      it to the base directory.
+    - "*" crosses "/" in the built-in matcher, so "src/*.gen" also matches
+      "src/y/x.gen"; pathspec stops at "/".
+    - "**" only matches in pathspec where it stands for zero directories
+      ("a/**/b" matches "a/b").
+
+    Patterns are compiled on first use. As in gitignore, the last matching
+    pattern wins and "!pattern" re-includes a path. Consecutive patterns
+    with the same verdict are compiled together into one _PatternGroup, so
+    a pattern list without negations is a single group, and groups are
+    checked from last to first until one matches. Use
+    add_pattern/remove_pattern to change patterns so the compiled form is
+    rebuilt.
+
+    Results past the name check are cached by (relative path, is_dir), so a
+    path checked again skips the directory and path patterns. On a spec you
+    created yourself, call clear_cache() after editing self.patterns
+    directly (for example when a .gitignore was reloaded). Specs from
+    build_ignore_spec and spec_for_patterns are shared and their patterns
+    cannot be edited; copy() them first.
     """
     
-    def __init__(self, patterns: Optional[List[str]] = None):
+    def __init__(
+        self,
+        patterns: Optional[List[str]] = None,
+        use_pathspec: bool = False,
+    ):
         """Initialize ignore spec with patterns.
         
         Args:
             patterns: List of gitignore-style patterns
+            use_pathspec: Match with pathspec instead of the built-in matcher
+
+        Raises:
+            ImportError: If use_pathspec is set but pathspec is not installed
         """
-        self.patterns = patterns or []
+        if use_pathspec and pathspec is None:
+            raise ImportError(
+                'use_pathspec needs pathspec: pip install "augustus[gitignore]"'
+            )
+        # Pattern lists repeat across specs (defaults, memoized builds); intern
+        # them so every spec shares one copy of each string
+        self.patterns = [sys.intern(pattern) for pattern in patterns or []]
+        self._pattern_set: Set[str] = set(self.patterns)
+        self.use_pathspec = use_pathspec
+        self._compiled = False
+        self._pathspec: Optional["pathspec.PathSpec"] = None
+        self._groups: List[_PatternGroup] = []
+        self._cache: Dict[Tuple[str, bool], bool] = {}
     
-    def should_ignore(self, path: Path, base_path: Optional[Path] = None) -> bool:
+    def _compile(self) -> None:
+        """Compile patterns into groups of consecutive same-verdict patterns."""
+        self._groups = []
+        if self.use_pathspec:
+            self._pathspec = pathspec.GitIgnoreSpec.from_lines(self.patterns)
+            self._compiled = True
+            return
+
+        run: List[str] = []
+        run_ignore = True
+        for raw_pattern in self.patterns:
+            pattern = raw_pattern.strip()
+
+            ignore = not pattern.startswith("!")
+            if not ignore:
+                pattern = pattern[1:]
+            elif pattern.startswith("\\!"):
+                # "\!name" is a literal name starting with "!"
+                pattern = pattern[1:]
+
+            if ignore != run_ignore and run:
+                self._groups.append(_PatternGroup(run_ignore, run))
+                run = []
+            run_ignore = ignore
+            run.append(pattern)
+
+        if run:
+            self._groups.append(_PatternGroup(run_ignore, run))
+        self._compiled = True
+
+    def should_ignore(
+        self,
+        path: Path,
+        base_path: Optional[Path] = None,
+        is_dir: Optional[bool] = None,
+    ) -> bool:
         """Check if a path should be ignored.
         
         Args:
             path: Path to check
             base_path: Base path for relative matching
+            is_dir: Whether path is a directory, if the caller already knows
+                (saves a stat call)
             
         Returns:
-            True if path matches any ignore pattern
+            True if the last pattern matching path ignores it
         """
         if not self.patterns:
             return False
-        
+
+        if not self._compiled:
+            self._compile()
+
+        name = path.name
+        # Checked before is_dir so an ignored name never costs a stat
+        verdict = self._match_last_name(name)
+        if verdict is not None:
+            return verdict
+
+        if is_dir is None:
+            is_dir = path.is_dir()
+
         # Get relative path if base_path provided
         if base_path:
             try:
@@ -47,64 +293,110 @@ class IgnoreSpec:
                 rel_path = path
         else:
             rel_path = path
-        
-        path_str = str(rel_path)
-        name = path.name
-        
-        for pattern in self.patterns:
-            if self._matches_pattern(name, path_str, pattern, path.is_dir()):
-                return True
-        
-        return False
-    
-    def _matches_pattern(
+
+        return self._match_path(name, rel_path.as_posix(), is_dir)
+
+    def should_ignore_fast(self, name: str, rel_path: str, is_dir: bool) -> bool:
+        """Check a path the caller has already split into strings.
+
+        For directory walkers that track the relative path as they descend,
+        so no Path objects are built per entry.
+
+        Args:
+            name: Final path component
+            rel_path: Path relative to the base, "/"-separated
+            is_dir: Whether the path is a directory
+
+        Returns:
+            True if the last pattern matching the path ignores it
+        """
+        if not self.patterns:
+            return False
+
+        if not self._compiled:
+            self._compile()
+
+        verdict = self._match_last_name(name)
+        if verdict is not None:
+            return verdict
+        return self._match_path(name, rel_path, is_dir)
+
+    def should_ignore_entry(
         self,
-        name: str,
-        path_str: str,
-        pattern: str,
-        is_dir: bool,
+        entry: "os.DirEntry[str]",
+        base_path: Optional[Path] = None,
     ) -> bool:
-        """Check if a path matches a specific pattern.
-        
+        """Check if a scandir entry should be ignored.
+
+        DirEntry.is_dir() is answered from the directory listing, so this
+        avoids the stat call should_ignore would make.
+
         Args:
-            name: File/directory name
-            path_str: Full path string
-            pattern: Pattern to match against
-            is_dir: Whether path is a directory
-            
+            entry: Entry from os.scandir
+            base_path: Base path for relative matching
+
         Returns:
-            True if pattern matches
+            True if the last pattern matching the entry ignores it
         """
-        # Remove leading/trailing slashes
-        pattern = pattern.strip()
-        
-        # Skip empty patterns
-        if not pattern:
-            return False
-        
-        # Directory-specific patterns
-        if pattern.endswith("/"):
-            if not is_dir:
-                return False
-            pattern = pattern[:-1]
-        
-        # Exact name match
-        if pattern == name:
-            return True
-        
-        # Wildcard matching
-        if "*" in pattern or "?" in pattern:
-            # Simple wildcard on name
-            if "/" not in pattern:
-                return fnmatch.fnmatch(name, pattern)
-            # Path-based wildcard
-            return fnmatch.fnmatch(path_str, pattern)
-        
-        # Substring match for paths
-        if "/" in pattern:
-            return pattern in path_str
-        
+        return self.should_ignore(
+            Path(entry.path), base_path=base_path, is_dir=entry.is_dir()
+        )
+
+    def _match_last_name(self, name: str) -> Optional[bool]:
+        """Return the last group's verdict if its name patterns match.
+
+        No later pattern can override the last group, so a name match there
+        is final. Returns None when it does not match (or with pathspec).
+        """
+        if not self._groups:
+            return None
+        group = self._groups[-1]
+        return group.ignore if group.match_name(name) else None
+
+    def _match_path(self, name: str, rel_path: str, is_dir: bool) -> bool:
+        """Match the remaining patterns, caching by (rel_path, is_dir)."""
+        key = (rel_path, is_dir)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+
+        result = self._evaluate(name, rel_path, is_dir)
+
+        if len(self._cache) >= _MATCH_CACHE_SIZE:
+            # Dicts keep insertion order, so this evicts the oldest entry
+            self._cache.pop(next(iter(self._cache)))
+        self._cache[key] = result
+        return result
+
+    def _evaluate(self, name: str, path_str: str, is_dir: bool) -> bool:
+        """Return the verdict of the last matching pattern (False if none)."""
+        if self._pathspec is not None:
+            # pathspec marks directories with a trailing slash
+            return self._pathspec.match_file(path_str + "/" if is_dir else path_str)
+
+        # The last group's name patterns were already checked by the caller
+        last = len(self._groups) - 1
+        for index in range(last, -1, -1):
+            group = self._groups[index]
+            if group.match_path(name, path_str, is_dir):
+                return group.ignore
+            if index < last and group.match_name(name):
+                return group.ignore
+
         return False
+
+    def copy(self) -> "IgnoreSpec":
+        """Return an independent IgnoreSpec with the same patterns."""
+        return IgnoreSpec(list(self.patterns), use_pathspec=self.use_pathspec)
+
+    def clear_cache(self) -> None:
+        """Forget cached match results and recompile patterns on next use.
+
+        Only needed after editing self.patterns of a private IgnoreSpec.
+        """
+        self._pattern_set = set(self.patterns)
+        self._cache.clear()
+        self._compiled = False
     
     def add_pattern(self, pattern: str) -> None:
         """Add a new ignore pattern.
@@ -112,8 +404,11 @@ class IgnoreSpec:
         Args:
             pattern: Pattern to add
         """
-        if pattern and pattern not in self.patterns:
+        if pattern and pattern not in self._pattern_set:
             self.patterns.append(pattern)
+            self._pattern_set.add(pattern)
+            self._compiled = False
+            self._cache.clear()
     
     def remove_pattern(self, pattern: str) -> None:
         """Remove an ignore pattern.
@@ -121,12 +416,36 @@ class IgnoreSpec:
         Args:
             pattern: Pattern to remove
         """
-        if pattern in self.patterns:
+        if pattern in self._pattern_set:
             self.patterns.remove(pattern)
+            if pattern not in self.patterns:
+                self._pattern_set.discard(pattern)
+            self._compiled = False
+            self._cache.clear()
+
+
+class _SharedIgnoreSpec(IgnoreSpec):
+    """IgnoreSpec handed out by build_ignore_spec to every caller; read-only.
+
+    Patterns are kept in a tuple so they cannot be edited in place either.
+    """
+
+    def __init__(self, patterns: List[str], use_pathspec: bool = False):
+        super().__init__(patterns, use_pathspec=use_pathspec)
+        self.patterns = tuple(self.patterns)  # type: ignore[assignment]
+
+    def add_pattern(self, pattern: str) -> None:
+        raise TypeError("This IgnoreSpec is shared; call copy() before changing it")
+
+    def remove_pattern(self, pattern: str) -> None:
+        raise TypeError("This IgnoreSpec is shared; call copy() before changing it")
 
 
 def load_gitignore(path: Path) -> List[str]:
     """Load patterns from a .gitignore file.
+
+    Parsed patterns are cached by path and reused while the file's size and
+    modification time are unchanged.
     
     Args:
         path: Path to .gitignore file
@@ -134,22 +453,45 @@ def load_gitignore(path: Path) -> List[str]:
     Returns:
         List of patterns (excluding comments and empty lines)
     """
-    if not path.exists() or not path.is_file():
-        return []
-    
-    patterns = []
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                # Skip comments and empty lines
-                if line and not line.startswith("#"):
-                    patterns.append(line)
-    except Exception:
-        # If we can't read the file, return empty list
-        pass
-    
-    return patterns
+        st = path.stat()
+    except OSError:
+        return []
+    if not stat.S_ISREG(st.st_mode):
+        return []
+
+    key = str(path)
+    cached = _GITIGNORE_CACHE.get(key)
+    if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+        return list(cached[2])
+
+    # An empty .gitignore is common; there is nothing to read
+    data = b""
+    if st.st_size:
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError:
+            # If we can't read the file, return empty list
+            return []
+
+    # Filter as bytes and decode only the surviving patterns. bytes.splitlines
+    # also splits on \n, \r and \r\n only, as git does.
+    stripped = (line.strip() for line in data.splitlines())
+    patterns = [
+        line.decode("utf-8", "replace")
+        for line in stripped
+        if line and not line.startswith(b"#")
+    ]
+    _GITIGNORE_CACHE[key] = (st.st_mtime_ns, st.st_size, patterns)
+    return list(patterns)
+
+
+def clear_gitignore_cache() -> None:
+    """Forget parsed .gitignore files and memoized ignore specs."""
+    _GITIGNORE_CACHE.clear()
+    _spec_for_patterns.cache_clear()
+    _default_spec.cache_clear()
 
 
 def merge_patterns(
@@ -165,29 +507,39 @@ def merge_patterns(
     Returns:
         Combined list of unique patterns
     """
-    merged = list(default_patterns)
-    
+    # Dicts keep insertion order, so this dedupes in one pass
+    merged = dict.fromkeys(default_patterns)
     if custom_patterns:
-        for pattern in custom_patterns:
-            if pattern not in merged:
-                merged.append(pattern)
-    
-    return merged
+        merged.update(dict.fromkeys(custom_patterns))
+    return list(merged)
 
 
 def build_ignore_spec(
     base_path: Optional[Path] = None,
     extra_patterns: Optional[List[str]] = None,
+    use_pathspec: bool = False,
 ) -> IgnoreSpec:
     """Build an IgnoreSpec from defaults and optional .gitignore.
 
+    Specs are memoized by their final pattern list and backend, so repeated
+    builds share one compiled IgnoreSpec; the defaults-only spec is built
+    once per process. The result is read-only: call copy() before
+    add_pattern/remove_pattern.
+
     Args:
         base_path: Base directory for .gitignore lookup
         extra_patterns: Additional patterns to include
+        use_pathspec: Match with pathspec instead of the built-in matcher
 
     Returns:
         IgnoreSpec configured with merged patterns
+
+    Raises:
+        ImportError: If use_pathspec is set but pathspec is not installed
     """
+    if base_path is None and not extra_patterns:
+        return _default_spec(use_pathspec)
+
     patterns = merge_patterns(DEFAULT_IGNORE_PATTERNS, extra_patterns)
 
     if base_path is not None:
@@ -195,7 +547,42 @@ def build_ignore_spec(
         gitignore_patterns = load_gitignore(gitignore_path)
         patterns = merge_patterns(patterns, gitignore_patterns)
 
-    return IgnoreSpec(patterns)
+    return _spec_for_patterns(tuple(patterns), use_pathspec)
+
+
+def spec_for_patterns(
+    patterns: Optional[List[str]] = None,
+    use_pathspec: bool = False,
+) -> IgnoreSpec:
+    """Return an IgnoreSpec for exactly these patterns (no defaults).
+
+    The result is shared and read-only, like build_ignore_spec's.
+
+    Args:
+        patterns: gitignore-style patterns
+        use_pathspec: Match with pathspec instead of the built-in matcher
+
+    Returns:
+        IgnoreSpec for the patterns
+
+    Raises:
+        ImportError: If use_pathspec is set but pathspec is not installed
+    """
+    return _spec_for_patterns(tuple(patterns or ()), use_pathspec)
+
+
+@functools.lru_cache(maxsize=16)
+def _spec_for_patterns(patterns: Tuple[str, ...], use_pathspec: bool) -> IgnoreSpec:
+    """Return the shared IgnoreSpec for a pattern list."""
+    return _SharedIgnoreSpec(list(patterns), use_pathspec=use_pathspec)
+
+
+@functools.lru_cache(maxsize=None)
+def _default_spec(use_pathspec: bool) -> IgnoreSpec:
+    """Return the shared IgnoreSpec for the default patterns alone."""
+    return _spec_for_patterns(
+        tuple(merge_patterns(DEFAULT_IGNORE_PATTERNS)), use_pathspec
+    )
 
 
 def should_ignore(
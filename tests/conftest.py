@@ -0,0 +1,19 @@
+"""Shared fixtures for the Augustus test suite."""
+
+import pytest
+
+from augustus.ingest.loader import PARALLEL_MIN_FILES
+
+
+@pytest.fixture(scope="session")
+def text_folder(tmp_path_factory):
+    """A folder of small text files plus one binary file, created once.
+
+    Enough files to take the loader's parallel path. Shared by every test
+    in the session, so tests must only read it.
+    """
+    folder = tmp_path_factory.mktemp("text_folder")
+    for i in range(PARALLEL_MIN_FILES + 5):
+        (folder / f"file{i:03d}.txt").write_text(f"Content {i}")
+    (folder / "blob.bin").write_bytes(b"\x00\x01")
+    return folder
@@ -0,0 +1,19 @@
+"""Tests for the answer module."""
+
+from augustus.qa.answer import format_answer
+
+
+class TestFormatAnswer:
+    """Tests for format_answer function."""
+
+    def test_lists_sources(self):
+        """Citations should be numbered under a Sources heading."""
+        formatted = format_answer("It is 42.", [{"source": "a.md"}, {}])
+
+        assert formatted == "It is 42.\n\nSources:\n1. a.md\n2. unknown\n"
+
+    def test_without_citations(self):
+        """The answer should be returned as-is when citations are off or empty."""
+        assert format_answer("Hi", []) == "Hi"
+        citations = [{"source": "a.md"}]
+        assert format_answer("Hi", citations, include_citations=False) == "Hi"
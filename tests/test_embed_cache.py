@@ -0,0 +1,35 @@
+"""Tests for the embedding cache module."""
+
+from augustus.ingest.embed_cache import EmbeddingCache, content_hash
+
+
+class TestEmbeddingCache:
+    """Tests for EmbeddingCache class."""
+
+    def test_round_trip(self, tmp_path):
+        """Stored vectors should come back for the same model and hash."""
+        key = content_hash("hello")
+
+        with EmbeddingCache(tmp_path / "cache.db") as cache:
+            cache.put_many("model-a", [(key, [0.5, -1.0, 2.0])])
+
+        with EmbeddingCache(tmp_path / "cache.db") as cache:
+            found = cache.get_many("model-a", [key])
+
+        assert list(found[key]) == [0.5, -1.0, 2.0]
+
+    def test_keyed_by_model(self, tmp_path):
+        """Vectors from one model should not be returned for another."""
+        key = content_hash("hello")
+
+        with EmbeddingCache(tmp_path / "cache.db") as cache:
+            cache.put_many("model-a", [(key, [1.0])])
+            assert cache.get_many("model-b", [key]) == {}
+
+    def test_missing_hashes_are_omitted(self, tmp_path):
+        """Only hashes present in the cache should be returned."""
+        with EmbeddingCache(tmp_path / "cache.db") as cache:
+            cache.put_many("model-a", [(content_hash("a"), [1.0])])
+            found = cache.get_many("model-a", [content_hash("a"), content_hash("b")])
+
+        assert list(found) == [content_hash("a")]
@@ -0,0 +1,158 @@
+"""Tests for the file tree module."""
+
+import pytest
+
+from augustus.utils.file_tree import collect_files, count_files, generate_tree
+
+
+def _make_tree(tmp_path):
+    """Create a small tree with a build directory and a file named build."""
+    for rel_path in ["src/app.py", "src/build", "build/out.js", "notes.md"]:
+        path = tmp_path / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("x")
+
+
+class TestGenerateTree:
+    """Tests for generate_tree function."""
+
+    def test_directories_first_then_names(self, tmp_path):
+        """Entries should list directories first, each group sorted by name."""
+        _make_tree(tmp_path)
+
+        lines = generate_tree(tmp_path).splitlines()
+
+        assert lines[1:] == [
+            "├── build/",
+            "│   └── out.js",
+            "├── src/",
+            "│   ├── app.py",
+            "│   └── build",
+            "└── notes.md",
+        ]
+
+    def test_directory_pattern_keeps_files(self, tmp_path):
+        """A "build/" pattern should hide the directory but not a file."""
+        _make_tree(tmp_path)
+
+        tree = generate_tree(tmp_path, ignore_patterns=["build/"])
+
+        assert "out.js" not in tree
+        assert "│   └── build" in tree
+
+    def test_max_depth(self, tmp_path):
+        """max_depth should stop the walk below the given depth."""
+        _make_tree(tmp_path)
+
+        tree = generate_tree(tmp_path, max_depth=1)
+
+        assert "src/" in tree
+        assert "app.py" not in tree
+
+
+class TestCountFiles:
+    """Tests for count_files function."""
+
+    def test_counts_files_and_directories(self, tmp_path):
+        """Ignored entries should not be counted."""
+        _make_tree(tmp_path)
+
+        assert count_files(tmp_path) == (4, 2)
+        assert count_files(tmp_path, ignore_patterns=["*.md"]) == (3, 2)
+
+    def test_negated_pattern_is_counted(self, tmp_path):
+        """A re-included file should be counted again."""
+        _make_tree(tmp_path)
+
+        assert count_files(tmp_path, ignore_patterns=["*.md", "!notes.md"]) == (4, 2)
+
+    def test_ignored_directory_is_pruned(self, tmp_path):
+        """Files inside an ignored directory should not be counted."""
+        _make_tree(tmp_path)
+
+        assert count_files(tmp_path, ignore_patterns=["build/"]) == (3, 1)
+
+
+class TestSameRulesAsIngest:
+    """The tree and count helpers should match the way ingestion does."""
+
+    def test_path_pattern_agrees_with_collect_files(self, tmp_path):
+        """A slash pattern should hide the same file from every helper."""
+        path = tmp_path / "x" / "docs" / "tmp"
+        path.parent.mkdir(parents=True)
+        path.write_text("x")
+        patterns = ["docs/tmp"]
+
+        records, _ = collect_files(tmp_path, extra_ignore_patterns=patterns)
+
+        # The built-in matcher finds literal path patterns anywhere
+        assert records == []
+        assert "tmp" not in generate_tree(tmp_path, ignore_patterns=patterns)
+        assert count_files(tmp_path, ignore_patterns=patterns)[0] == 0
+
+    def test_pathspec_is_opt_in(self, tmp_path):
+        """use_pathspec should reach the tree and count helpers."""
+        pytest.importorskip("pathspec")
+        path = tmp_path / "x" / "docs" / "tmp"
+        path.parent.mkdir(parents=True)
+        path.write_text("x")
+        patterns = ["docs/tmp"]
+
+        tree = generate_tree(tmp_path, ignore_patterns=patterns, use_pathspec=True)
+        counts = count_files(tmp_path, ignore_patterns=patterns, use_pathspec=True)
+
+        assert "tmp" in tree
+        assert counts[0] == 1
+
+
+class TestCollectFiles:
+    """Tests for collect_files function."""
+
+    def test_absolute_path_joins_root(self, tmp_path):
+        """Absolute paths should be the resolved root plus the relative path."""
+        _make_tree(tmp_path)
+
+        records, _ = collect_files(tmp_path)
+
+        # build/ is in the default ignore patterns
+        assert [record.relative_path for record in records] == [
+            "notes.md",
+            "src/app.py",
+            "src/build",
+        ]
+        for record in records:
+            assert record.absolute_path == tmp_path.resolve() / record.relative_path
+
+    def test_extensions_are_shared(self, tmp_path):
+        """Records with the same extension should share one string."""
+        for name in ["a.py", "b.PY", "c.py"]:
+            (tmp_path / name).write_text("x")
+
+        records, _ = collect_files(tmp_path)
+
+        assert len({id(record.extension) for record in records}) == 1
+
+    def test_ignored_directory_is_checked_once(self, tmp_path):
+        """An ignored directory should count once and its files not at all."""
+        for i in range(5):
+            path = tmp_path / "node_modules" / "pkg" / f"mod{i}.js"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("x")
+        (tmp_path / "main.py").write_text("x")
+
+        records, ignored = collect_files(tmp_path)
+
+        assert [record.relative_path for record in records] == ["main.py"]
+        assert ignored == 1
+
+    def test_symlinked_file_reports_target_size(self, tmp_path):
+        """A symlinked file should carry its target's size, not the link's."""
+        target = tmp_path / "data" / "big.txt"
+        target.parent.mkdir()
+        target.write_text("x" * 500)
+        (tmp_path / "link.txt").symlink_to(target)
+
+        records, _ = collect_files(tmp_path)
+
+        sizes = {record.relative_path: record.size_bytes for record in records}
+        assert sizes == {"data/big.txt": 500, "link.txt": 500}
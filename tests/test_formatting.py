@@ -0,0 +1,49 @@
+"""Tests for the formatting module."""
+
+from augustus.utils.formatting import format_table, truncate, wrap_text
+
+
+class TestFormatTable:
+    """Tests for format_table function."""
+
+    def test_widths_fit_longest_value(self):
+        """Columns should be as wide as their longest cell plus two."""
+        table = format_table(["Name", "Size"], [["a.txt", "10"], ["long.md", "2"]])
+
+        assert table.splitlines() == [
+            "Name     Size  ",
+            "---------------",
+            "a.txt    10    ",
+            "long.md  2     ",
+        ]
+
+    def test_short_rows(self):
+        """Rows with fewer cells should not shrink the other columns."""
+        table = format_table(["A", "B"], [["x"], ["y", "value"]])
+
+        assert table.splitlines()[0] == "A  B      "
+
+    def test_empty_rows(self):
+        """No rows should give an empty string."""
+        assert format_table(["A"], []) == ""
+
+
+class TestTruncate:
+    """Tests for truncate function."""
+
+    def test_short_text_unchanged(self):
+        """Text within the limit should be returned as-is."""
+        assert truncate("hello", 5) == "hello"
+
+    def test_suffix_counts_toward_length(self):
+        """Truncated text including the suffix should fit max_length."""
+        assert truncate("hello world", 8) == "hello..."
+        assert truncate("hello world", 8, suffix="~") == "hello w~"
+
+
+class TestWrapText:
+    """Tests for wrap_text function."""
+
+    def test_wraps_and_indents(self):
+        """Lines after the first should be indented."""
+        assert wrap_text("one two three", width=8, indent=2) == "one two\n  three"
@@ -0,0 +1,364 @@
+"""Tests for the ignore pattern module."""
+
+import os
+
+import pytest
+
+from augustus.config import DEFAULT_IGNORE_PATTERNS
+from augustus.utils import ignore
+from augustus.utils.ignore import (
+    IgnoreSpec,
+    build_ignore_spec,
+    clear_gitignore_cache,
+    load_gitignore,
+    merge_patterns,
+    spec_for_patterns,
+)
+
+
+def _make(tmp_path, rel_path, is_dir=False):
+    """Create a file or directory under tmp_path and return its path."""
+    path = tmp_path / rel_path
+    if is_dir:
+        path.mkdir(parents=True)
+    else:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("x")
+    return path
+
+
+class TestIgnoreSpec:
+    """Tests for IgnoreSpec class."""
+
+    def test_default_patterns(self, tmp_path):
+        """Default patterns should ignore common junk but keep source files."""
+        spec = IgnoreSpec(list(DEFAULT_IGNORE_PATTERNS))
+
+        assert spec.should_ignore(_make(tmp_path, "node_modules", is_dir=True))
+        assert spec.should_ignore(_make(tmp_path, "pkg/mod.pyc"))
+        assert spec.should_ignore(_make(tmp_path, ".env"))
+        assert spec.should_ignore(_make(tmp_path, "app.egg-info", is_dir=True))
+        assert not spec.should_ignore(_make(tmp_path, "src/main.py"))
+
+    def test_directory_pattern_skips_files(self, tmp_path):
+        """Patterns ending in "/" should only match directories."""
+        spec = IgnoreSpec(["build/"])
+
+        assert spec.should_ignore(_make(tmp_path, "build", is_dir=True))
+        assert not spec.should_ignore(_make(tmp_path, "docs/build"))
+
+    def test_path_patterns(self, tmp_path):
+        """Patterns with a slash should match against the relative path."""
+        spec = IgnoreSpec(["docs/*.md", "gen/out"])
+
+        assert spec.should_ignore(_make(tmp_path, "docs/a.md"), base_path=tmp_path)
+        assert spec.should_ignore(
+            _make(tmp_path, "src/gen/out", is_dir=True), base_path=tmp_path
+        )
+        assert not spec.should_ignore(_make(tmp_path, "a.md"), base_path=tmp_path)
+
+    def test_directory_path_pattern_skips_files(self, tmp_path):
+        """A literal path pattern ending in "/" should only match directories."""
+        spec = IgnoreSpec(["gen/out/"])
+
+        assert spec.should_ignore(
+            _make(tmp_path, "src/gen/out", is_dir=True), base_path=tmp_path
+        )
+        assert not spec.should_ignore(_make(tmp_path, "gen/out"), base_path=tmp_path)
+
+    def test_is_dir_hint_skips_stat(self, tmp_path):
+        """A caller-supplied is_dir should be trusted, even for missing paths."""
+        spec = IgnoreSpec(["build/"])
+        path = tmp_path / "build"
+
+        assert spec.should_ignore(path, is_dir=True)
+        assert not spec.should_ignore(path, is_dir=False)
+
+    def test_should_ignore_entry(self, tmp_path):
+        """scandir entries should match like the paths they point to."""
+        _make(tmp_path, "build", is_dir=True)
+        _make(tmp_path, "src/build")
+        spec = IgnoreSpec(["build/"])
+
+        with os.scandir(tmp_path) as root, os.scandir(tmp_path / "src") as src:
+            entries = {entry.path: entry for entry in [*root, *src]}
+
+        assert spec.should_ignore_entry(entries[str(tmp_path / "build")])
+        assert not spec.should_ignore_entry(entries[str(tmp_path / "src" / "build")])
+
+    def test_should_ignore_fast(self):
+        """Pre-split strings should match without touching the filesystem."""
+        spec = IgnoreSpec(["*.log", "build/", "docs/*.md"])
+
+        assert spec.should_ignore_fast("app.log", "src/app.log", False)
+        assert spec.should_ignore_fast("build", "src/build", True)
+        assert not spec.should_ignore_fast("build", "src/build", False)
+        assert spec.should_ignore_fast("a.md", "docs/a.md", False)
+        assert not spec.should_ignore_fast("a.md", "a.md", False)
+
+    def test_anchored_patterns(self, tmp_path):
+        """A leading "/" should only match at the base directory."""
+        spec = IgnoreSpec(["/root.txt", "/build/"])
+
+        assert spec.should_ignore(_make(tmp_path, "root.txt"), base_path=tmp_path)
+        assert not spec.should_ignore(
+            _make(tmp_path, "sub/root.txt"), base_path=tmp_path
+        )
+        assert not spec.should_ignore(
+            _make(tmp_path, "root.txt.bak"), base_path=tmp_path
+        )
+        assert spec.should_ignore(
+            _make(tmp_path, "build", is_dir=True), base_path=tmp_path
+        )
+        assert spec.should_ignore(_make(tmp_path, "build/out.js"), base_path=tmp_path)
+        assert not spec.should_ignore(
+            _make(tmp_path, "src/build", is_dir=True), base_path=tmp_path
+        )
+
+    def test_negation_reincludes(self, tmp_path):
+        """A "!" pattern should re-include what an earlier pattern ignored."""
+        spec = IgnoreSpec(["*.log", "!keep.log", "docs/", "!docs/"])
+
+        assert spec.should_ignore(_make(tmp_path, "app.log"))
+        assert not spec.should_ignore(_make(tmp_path, "keep.log"))
+        assert not spec.should_ignore(_make(tmp_path, "docs", is_dir=True))
+
+    def test_last_matching_pattern_wins(self, tmp_path):
+        """A pattern after a negation should ignore the path again."""
+        spec = IgnoreSpec(["*.log", "!*.log", "debug.log", r"\!bang"])
+
+        assert not spec.should_ignore(_make(tmp_path, "app.log"))
+        assert spec.should_ignore(_make(tmp_path, "debug.log"))
+        assert spec.should_ignore(_make(tmp_path, "!bang"))
+
+    def test_wildcards_match_whole_name(self, tmp_path):
+        """Wildcards should match the full name, not a prefix."""
+        spec = IgnoreSpec(["*.log", "tmp?"])
+
+        assert spec.should_ignore(_make(tmp_path, "app.log"))
+        assert spec.should_ignore(_make(tmp_path, "tmp1"))
+        assert not spec.should_ignore(_make(tmp_path, "app.log.txt"))
+        assert not spec.should_ignore(_make(tmp_path, "tmp12"))
+
+    def test_suffix_patterns(self, tmp_path):
+        """"*.ext" patterns should match by suffix, alongside other wildcards."""
+        spec = IgnoreSpec(["*.pyc", "*.min.js", "*.log/"])
+
+        assert spec.should_ignore(_make(tmp_path, "mod.pyc"))
+        assert spec.should_ignore(_make(tmp_path, ".pyc"))
+        assert spec.should_ignore(_make(tmp_path, "app.min.js"))
+        assert spec.should_ignore(_make(tmp_path, "old.log", is_dir=True))
+        assert not spec.should_ignore(_make(tmp_path, "mod.pyc.txt"))
+        assert not spec.should_ignore(_make(tmp_path, "app.js"))
+        assert not spec.should_ignore(_make(tmp_path, "new.log"))
+
+    def test_patterns_are_copied(self):
+        """The spec should keep its own pattern list, not the caller's."""
+        patterns = ["*.log"]
+        spec = IgnoreSpec(patterns)
+        patterns.append("*.tmp")
+
+        assert spec.patterns == ["*.log"]
+
+    def test_character_class(self, tmp_path):
+        """Brackets should be treated as a character class, not literally."""
+        spec = IgnoreSpec(["data[0-9]", "logs/run[ab].txt"])
+
+        assert spec.should_ignore(_make(tmp_path, "data1"))
+        assert not spec.should_ignore(_make(tmp_path, "datax"))
+        assert spec.should_ignore(
+            _make(tmp_path, "logs/runa.txt"), base_path=tmp_path
+        )
+        assert not spec.should_ignore(
+            _make(tmp_path, "logs/runc.txt"), base_path=tmp_path
+        )
+
+    def test_add_and_remove_pattern(self, tmp_path):
+        """Changing patterns after a check should take effect."""
+        path = _make(tmp_path, "notes.txt")
+        spec = IgnoreSpec(["*.md"])
+        assert not spec.should_ignore(path)
+
+        spec.add_pattern("*.txt")
+        assert spec.should_ignore(path)
+
+        spec.remove_pattern("*.txt")
+        assert not spec.should_ignore(path)
+
+    def test_cached_results_follow_pattern_changes(self, tmp_path):
+        """Adding a path pattern should not return a stale cached result."""
+        path = _make(tmp_path, "docs/a.md")
+        spec = IgnoreSpec(["*.log"])
+        assert not spec.should_ignore(path, base_path=tmp_path)
+        assert not spec.should_ignore(path, base_path=tmp_path)
+
+        spec.add_pattern("docs/*.md")
+        assert spec.should_ignore(path, base_path=tmp_path)
+
+    def test_clear_cache(self, tmp_path):
+        """clear_cache should pick up patterns edited in place."""
+        path = _make(tmp_path, "docs/a.md")
+        spec = IgnoreSpec(["*.log"])
+        assert not spec.should_ignore(path, base_path=tmp_path)
+
+        spec.patterns.append("docs/*.md")
+        spec.clear_cache()
+        assert spec.should_ignore(path, base_path=tmp_path)
+
+
+class TestPathspecMatcher:
+    """Tests for IgnoreSpec with use_pathspec=True."""
+
+    def test_full_gitignore_semantics(self, tmp_path):
+        """pathspec should handle anchoring, "**" and negation."""
+        pytest.importorskip("pathspec")
+        spec = IgnoreSpec(["/root.txt", "lib/**/gen", "*.log", "!keep.log"], True)
+
+        assert spec.should_ignore(_make(tmp_path, "root.txt"), base_path=tmp_path)
+        assert not spec.should_ignore(
+            _make(tmp_path, "sub/root.txt"), base_path=tmp_path
+        )
+        assert spec.should_ignore(
+            _make(tmp_path, "lib/a/b/gen", is_dir=True), base_path=tmp_path
+        )
+        assert spec.should_ignore(_make(tmp_path, "app.log"), base_path=tmp_path)
+        assert not spec.should_ignore(_make(tmp_path, "keep.log"), base_path=tmp_path)
+
+    def test_missing_pathspec(self, monkeypatch):
+        """Asking for pathspec without it installed should fail clearly."""
+        monkeypatch.setattr(ignore, "pathspec", None)
+
+        with pytest.raises(ImportError, match="augustus\\[gitignore\\]"):
+            IgnoreSpec(["*.log"], use_pathspec=True)
+
+
+# (pattern, relative path, built-in verdict, pathspec verdict) for files
+BACKEND_CASES = [
+    ("*.log", "x/app.log", True, True),
+    ("/root.txt", "sub/root.txt", False, False),
+    ("docs/tmp", "docs/tmp", True, True),
+    ("docs/tmp", "x/docs/tmp", True, False),
+    ("docs/tmp", "mydocs/tmpx", True, False),
+    ("src/*.gen", "src/x.gen", True, True),
+    ("src/*.gen", "src/y/x.gen", True, False),
+    ("a/**/b", "a/x/y/b", True, True),
+    ("a/**/b", "a/b", False, True),
+]
+
+
+class TestBackendDifferences:
+    """The documented cases where the built-in matcher and pathspec differ."""
+
+    @pytest.mark.parametrize("pattern, rel_path, builtin, _", BACKEND_CASES)
+    def test_builtin(self, pattern, rel_path, builtin, _):
+        """The built-in matcher should give its documented verdict."""
+        spec = IgnoreSpec([pattern])
+        name = rel_path.rsplit("/", 1)[-1]
+
+        assert spec.should_ignore_fast(name, rel_path, False) is builtin
+
+    @pytest.mark.parametrize("pattern, rel_path, _, expected", BACKEND_CASES)
+    def test_pathspec(self, pattern, rel_path, _, expected):
+        """pathspec should give its documented verdict."""
+        pytest.importorskip("pathspec")
+        spec = IgnoreSpec([pattern], use_pathspec=True)
+        name = rel_path.rsplit("/", 1)[-1]
+
+        assert spec.should_ignore_fast(name, rel_path, False) is expected
+
+    def test_builtin_is_the_default(self):
+        """Installing pathspec should not change which matcher is built."""
+        assert not build_ignore_spec().use_pathspec
+        assert not spec_for_patterns(["docs/tmp"]).use_pathspec
+
+
+class TestLoadGitignore:
+    """Tests for load_gitignore function."""
+
+    def test_skips_comments_and_blank_lines(self, tmp_path):
+        """Comments and blank lines should be dropped, patterns stripped."""
+        path = tmp_path / ".gitignore"
+        path.write_text("# build output\n\ndist/\n  *.log  \r\n")
+
+        assert load_gitignore(path) == ["dist/", "*.log"]
+
+    def test_undecodable_bytes_are_replaced(self, tmp_path):
+        """Invalid UTF-8 should not drop the other patterns."""
+        path = tmp_path / ".gitignore"
+        path.write_bytes(b"caf\xe9/\n*.tmp\n")
+
+        assert load_gitignore(path) == ["caf\ufffd/", "*.tmp"]
+
+    def test_empty_file(self, tmp_path):
+        """An empty .gitignore should give no patterns."""
+        path = tmp_path / ".gitignore"
+        path.write_bytes(b"")
+
+        assert load_gitignore(path) == []
+
+    def test_directory_is_skipped(self, tmp_path):
+        """A directory named .gitignore should not be read."""
+        (tmp_path / ".gitignore").mkdir()
+
+        assert load_gitignore(tmp_path / ".gitignore") == []
+
+    def test_missing_file(self, tmp_path):
+        """A missing .gitignore should give no patterns."""
+        assert load_gitignore(tmp_path / ".gitignore") == []
+
+    def test_edited_file_is_reread(self, tmp_path):
+        """A cached .gitignore should be re-read once it changes."""
+        path = tmp_path / ".gitignore"
+        path.write_text("*.log\n")
+        assert load_gitignore(path) == ["*.log"]
+
+        path.write_text("*.log\n*.tmp\n")
+        assert load_gitignore(path) == ["*.log", "*.tmp"]
+
+    def test_result_is_a_copy(self, tmp_path):
+        """Changing a returned list should not change the cached patterns."""
+        path = tmp_path / ".gitignore"
+        path.write_text("*.log\n")
+        load_gitignore(path).append("*.tmp")
+
+        assert load_gitignore(path) == ["*.log"]
+
+
+class TestMergePatterns:
+    """Tests for merge_patterns function."""
+
+    def test_keeps_first_occurrence_order(self):
+        """Duplicates should be dropped, keeping the first position."""
+        merged = merge_patterns(["*.pyc", ".git/", "*.pyc"], [".env", ".git/", "*.log"])
+
+        assert merged == ["*.pyc", ".git/", ".env", "*.log"]
+
+
+class TestBuildIgnoreSpec:
+    """Tests for build_ignore_spec function."""
+
+    def test_reuses_spec_until_gitignore_changes(self, tmp_path):
+        """The same inputs should share a spec; a new .gitignore should not."""
+        clear_gitignore_cache()
+        first = build_ignore_spec(tmp_path, ["*.tmp"])
+        assert build_ignore_spec(tmp_path, ["*.tmp"]) is first
+
+        (tmp_path / ".gitignore").write_text("*.log\n")
+        second = build_ignore_spec(tmp_path, ["*.tmp"])
+        assert second is not first
+        assert "*.log" in second.patterns
+
+    def test_defaults_only_spec_is_shared_and_read_only(self):
+        """The defaults-only spec should be shared and refuse changes."""
+        spec = build_ignore_spec()
+        assert build_ignore_spec() is spec
+        assert spec.patterns == tuple(DEFAULT_IGNORE_PATTERNS)
+
+        with pytest.raises(TypeError, match="copy"):
+            spec.add_pattern("*.tmp")
+        with pytest.raises(AttributeError):
+            spec.patterns.append("*.tmp")
+
+        copy = spec.copy()
+        copy.add_pattern("*.tmp")
+        assert "*.tmp" not in spec.patterns
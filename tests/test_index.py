@@ -1,16 +1,27 @@
 """Tests for the vector index module."""
 
+import json
 import pytest
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
+from langchain_core.embeddings import Embeddings
+
 from augustus.ingest.index import (
     VectorIndex,
     IngestSummary,
     ingest_dry_run,
+    ingest_folder,
     INDEX_DIR_NAME,
+    INDEX_FILE_NAME,
+    DOCSTORE_FILE_NAME,
+    _create_faiss_index,
+    _embed_texts,
 )
-from augustus.ingest.splitter import DocumentChunk
+from augustus.config import HNSW_MIN_VECTORS
+from augustus.ingest.loader import DOC_ID_SCHEME
+from augustus.ingest.manifest import MANIFEST_FILE_NAME
+from augustus.ingest.splitter import PARALLEL_SPLIT_MIN_DOCS, DocumentChunk
 
 
 class TestVectorIndex:
@@ -22,7 +33,7 @@ class TestVectorIndex:
 
         assert index.folder_path == tmp_path
         assert index.index_dir == tmp_path / INDEX_DIR_NAME
-        assert index._vectorstore is None
+        assert index._index is None
 
     def test_exists_returns_false_when_no_index(self, tmp_path):
         """exists() should return False when no index exists."""
@@ -33,8 +44,8 @@ class TestVectorIndex:
         """exists() should return True when index files exist."""
         index_dir = tmp_path / INDEX_DIR_NAME
         index_dir.mkdir()
-        (index_dir / "index.faiss").touch()
-        (index_dir / "index.pkl").touch()
+        (index_dir / INDEX_FILE_NAME).touch()
+        (index_dir / DOCSTORE_FILE_NAME).touch()
 
         index = VectorIndex(tmp_path)
         assert index.exists() is True
@@ -84,6 +95,316 @@ class TestVectorIndex:
         assert results == []
 
 
+class FakeEmbeddings:
+    """Embeddings stub that records request sizes and concurrency."""
+
+    def __init__(self):
+        self.batch_sizes = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def aembed_documents(self, texts):
+        import asyncio
+
+        self.batch_sizes.append(len(texts))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0)
+        self.in_flight -= 1
+        return [[float(len(text))] for text in texts]
+
+
+class TestEmbedTexts:
+    """Tests for _embed_texts helper."""
+
+    def test_preserves_order_across_batches(self):
+        """Vectors should come back in input order."""
+        texts = ["a" * i for i in range(1, 11)]
+        embeddings = FakeEmbeddings()
+
+        vectors = _embed_texts(embeddings, texts, batch_size=3, concurrency=2)
+
+        assert vectors == [[float(i)] for i in range(1, 11)]
+        assert embeddings.batch_sizes == [3, 3, 3, 1]
+
+    def test_limits_concurrency(self):
+        """No more than `concurrency` requests should be in flight."""
+        embeddings = FakeEmbeddings()
+
+        _embed_texts(embeddings, ["x"] * 20, batch_size=1, concurrency=4)
+
+        assert embeddings.max_in_flight == 4
+
+
+class TestCreateFaissIndex:
+    """Tests for _create_faiss_index helper."""
+
+    def test_small_index_is_exact(self):
+        """Small corpora should use exact flat search."""
+        import faiss
+
+        index = _create_faiss_index(8, HNSW_MIN_VECTORS - 1)
+
+        assert isinstance(index, faiss.IndexFlatL2)
+        assert index.d == 8
+
+    def test_large_index_uses_quantized_hnsw(self):
+        """Large corpora should use an HNSW graph over 8-bit vectors."""
+        import faiss
+
+        index = _create_faiss_index(8, HNSW_MIN_VECTORS)
+
+        assert isinstance(index, faiss.IndexHNSWSQ)
+        assert index.d == 8
+        assert index.is_trained is False
+
+
+class CountingEmbeddings(Embeddings):
+    """Deterministic embeddings that count how many texts were embedded."""
+
+    embedded = 0
+
+    def __init__(self, model=None, chunk_size=None):
+        pass
+
+    def embed_documents(self, texts):
+        CountingEmbeddings.embedded += len(texts)
+        return [[float(len(text)), 1.0] for text in texts]
+
+    def embed_query(self, text):
+        return [float(len(text)), 1.0]
+
+
+class TestEmbeddingCacheReuse:
+    """Tests for embedding reuse across builds."""
+
+    def test_rebuild_skips_cached_chunks(self, tmp_path, monkeypatch):
+        """A second build over the same chunks should embed nothing."""
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+        monkeypatch.setattr("langchain_openai.OpenAIEmbeddings", CountingEmbeddings)
+        CountingEmbeddings.embedded = 0
+        chunks = [
+            DocumentChunk(
+                id=f"doc_{i}",
+                content=f"chunk {i}",
+                source_path="a.txt",
+                chunk_index=i,
+                metadata={"source": "a.txt"},
+            )
+            for i in range(3)
+        ]
+
+        VectorIndex(tmp_path).build(chunks)
+        assert CountingEmbeddings.embedded == 3
+
+        new_chunk = DocumentChunk(
+            id="doc_3",
+            content="new chunk",
+            source_path="a.txt",
+            chunk_index=3,
+            metadata={"source": "a.txt"},
+        )
+        VectorIndex(tmp_path).build(chunks + [new_chunk])
+        assert CountingEmbeddings.embedded == 4
+
+
+class TestStreamingBuild:
+    """Tests for building from a chunk stream."""
+
+    def test_generator_across_windows(self, tmp_path, monkeypatch):
+        """A generator spanning several windows should index every chunk."""
+        import faiss
+
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+        monkeypatch.setattr("langchain_openai.OpenAIEmbeddings", CountingEmbeddings)
+        monkeypatch.setattr("augustus.ingest.index.HNSW_MIN_VECTORS", 3)
+        chunks = (
+            DocumentChunk(
+                id=f"doc_{i}",
+                content="x" * (i + 1),
+                source_path="a.txt",
+                chunk_index=i,
+                metadata={"source": "a.txt"},
+            )
+            for i in range(7)
+        )
+        index = VectorIndex(tmp_path)
+
+        count = index.build(chunks, batch_size=2, concurrency=1)
+
+        assert count == 7
+        assert index._ids == [f"doc_{i}" for i in range(7)]
+        assert isinstance(index._index, faiss.IndexHNSWSQ)
+        assert index._index.ntotal == 7
+
+
+class TestSaveLoad:
+    """Tests for index persistence."""
+
+    def test_round_trip(self, tmp_path, monkeypatch):
+        """A saved index should load back with the same chunks."""
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+        monkeypatch.setattr("langchain_openai.OpenAIEmbeddings", CountingEmbeddings)
+        chunks = [
+            DocumentChunk(
+                id=f"doc_{i}",
+                content="x" * (i + 1),
+                source_path=f"file{i}.txt",
+                chunk_index=0,
+                metadata={"source": f"file{i}.txt"},
+            )
+            for i in range(3)
+        ]
+        built = VectorIndex(tmp_path)
+        built.build(chunks)
+        built.save()
+
+        assert not (tmp_path / INDEX_DIR_NAME / "index.pkl").exists()
+
+        loaded = VectorIndex(tmp_path)
+        results = loaded.search("xx", k=1)
+
+        assert results[0]["content"] == "xx"
+        assert results[0]["metadata"] == {"source": "file1.txt"}
+        assert results[0]["score"] == 0.0
+
+    def test_search_with_k_above_index_size(self, tmp_path, monkeypatch):
+        """Asking for more results than chunks should return every chunk."""
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+        monkeypatch.setattr("langchain_openai.OpenAIEmbeddings", CountingEmbeddings)
+        chunk = DocumentChunk(
+            id="doc_0",
+            content="only chunk",
+            source_path="a.txt",
+            chunk_index=0,
+            metadata={"source": "a.txt"},
+        )
+        index = VectorIndex(tmp_path)
+        index.build([chunk])
+
+        results = index.search("query", k=5)
+
+        assert [result["content"] for result in results] == ["only chunk"]
+
+
+class TestIncrementalIngest:
+    """Tests for re-ingesting a folder with unchanged files."""
+
+    def test_only_changed_files_are_read(self, tmp_path, monkeypatch):
+        """Files with an unchanged size and mtime should not be loaded again."""
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+        monkeypatch.setattr("langchain_openai.OpenAIEmbeddings", CountingEmbeddings)
+        (tmp_path / "a.txt").write_text("alpha")
+        (tmp_path / "b.txt").write_text("beta")
+        first = ingest_folder(tmp_path)
+
+        (tmp_path / "b.txt").write_text("beta, edited")
+        read = []
+        original = Path.read_bytes
+
+        def tracking_read_bytes(path):
+            read.append(path.name)
+            return original(path)
+
+        monkeypatch.setattr(Path, "read_bytes", tracking_read_bytes)
+        second = ingest_folder(tmp_path)
+
+        assert read == ["b.txt"]
+        assert (first.loaded, first.chunks) == (2, 2)
+        assert (second.loaded, second.chunks) == (2, 2)
+        contents = [chunk.content for chunk in VectorIndex(tmp_path).stored_chunks()]
+        assert contents == ["alpha", "beta, edited"]
+
+    def test_new_chunk_settings_reload_everything(self, tmp_path, monkeypatch):
+        """Changing the chunk settings should not reuse old chunks."""
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+        monkeypatch.setattr("langchain_openai.OpenAIEmbeddings", CountingEmbeddings)
+        (tmp_path / "a.txt").write_text("one two three four")
+        ingest_folder(tmp_path, chunk_size=100, chunk_overlap=0)
+
+        summary = ingest_folder(tmp_path, chunk_size=10, chunk_overlap=0)
+
+        assert summary.chunks == 3
+
+    def test_other_id_scheme_reloads_everything(self, tmp_path, monkeypatch):
+        """A manifest written with another id scheme should not be trusted."""
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+        monkeypatch.setattr("langchain_openai.OpenAIEmbeddings", CountingEmbeddings)
+        (tmp_path / "a.txt").write_text("alpha")
+        ingest_folder(tmp_path)
+
+        manifest_path = VectorIndex(tmp_path).index_dir / MANIFEST_FILE_NAME
+        data = json.loads(manifest_path.read_text())
+        data["id_scheme"] = "sha256"
+        manifest_path.write_text(json.dumps(data))
+        read = []
+        original = Path.read_bytes
+
+        def tracking_read_bytes(path):
+            read.append(path.name)
+            return original(path)
+
+        monkeypatch.setattr(Path, "read_bytes", tracking_read_bytes)
+        ingest_folder(tmp_path)
+
+        assert read == ["a.txt"]
+        assert json.loads(manifest_path.read_text())["id_scheme"] == DOC_ID_SCHEME
+
+
+class TestParallelSplitIngest:
+    """Tests for splitting new files in a process pool during ingest."""
+
+    def test_matches_serial_ingest(self, tmp_path, monkeypatch):
+        """A pooled split should store the same chunks as a serial one."""
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+        monkeypatch.setattr("langchain_openai.OpenAIEmbeddings", CountingEmbeddings)
+        stored = {}
+        for workers in (1, 2):
+            folder = tmp_path / f"workers{workers}"
+            folder.mkdir()
+            for i in range(PARALLEL_SPLIT_MIN_DOCS + 2):
+                (folder / f"file{i:03d}.txt").write_text(f"Content {i} " * 30)
+
+            summary = ingest_folder(
+                folder, chunk_size=100, chunk_overlap=0, workers=workers
+            )
+
+            stored[workers] = [
+                (chunk.id, chunk.content)
+                for chunk in VectorIndex(folder).stored_chunks()
+            ]
+            assert summary.chunks == len(stored[workers])
+
+        assert stored[1] == stored[2]
+
+
+class TestIngestRoot:
+    """Tests for ingesting a folder given as a relative or symlinked path."""
+
+    @pytest.mark.parametrize("root", ["relative", "symlink"])
+    def test_relative_paths_are_kept(self, root, tmp_path, monkeypatch):
+        """Documents should keep their path below the folder, not just a name."""
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+        monkeypatch.setattr("langchain_openai.OpenAIEmbeddings", CountingEmbeddings)
+        real = tmp_path / "real"
+        (real / "sub").mkdir(parents=True)
+        (real / "sub" / "a.txt").write_text("alpha")
+        if root == "relative":
+            monkeypatch.chdir(tmp_path)
+            folder = Path("real")
+        else:
+            folder = tmp_path / "link"
+            folder.symlink_to(real, target_is_directory=True)
+
+        summary = ingest_folder(folder)
+        dry_run = ingest_dry_run(folder)
+
+        assert summary.sample_paths == ["sub/a.txt"]
+        assert dry_run.sample_paths == ["sub/a.txt"]
+        stored = VectorIndex(folder).stored_chunks()
+        assert [chunk.source_path for chunk in stored] == ["sub/a.txt"]
+
+
 class TestIngestDryRun:
     """Tests for ingest_dry_run function."""
 
@@ -100,15 +421,26 @@ class TestIngestDryRun:
         assert summary.chunks == 0  # dry-run doesn't chunk
         assert len(summary.sample_paths) <= 5
 
-    def test_respects_sample_size(self, tmp_path):
+    def test_respects_sample_size(self, text_folder):
         """ingest_dry_run should respect sample_size parameter."""
-        for i in range(10):
-            (tmp_path / f"file{i}.txt").write_text(f"Content {i}")
-
-        summary = ingest_dry_run(tmp_path, sample_size=3)
+        summary = ingest_dry_run(text_folder, sample_size=3)
 
         assert len(summary.sample_paths) == 3
 
+    def test_ignored_directory_is_not_walked(self, tmp_path):
+        """An ignored directory should count once, not once per file inside."""
+        for i in range(5):
+            path = tmp_path / "node_modules" / f"pkg{i}" / "index.js"
+            path.parent.mkdir(parents=True)
+            path.write_text("x")
+        (tmp_path / "main.py").write_text("print('hello')")
+
+        summary = ingest_dry_run(tmp_path)
+
+        assert summary.discovered == 1
+        assert summary.ignored == 1
+        assert summary.sample_paths == ["main.py"]
+
     def test_empty_folder(self, tmp_path):
         """ingest_dry_run should handle empty folders."""
         summary = ingest_dry_run(tmp_path)
@@ -0,0 +1,129 @@
+"""Tests for the file loader module."""
+
+from pathlib import Path
+
+import pytest
+import xxhash
+
+from augustus.ingest.loader import (
+    BINARY_SNIFF_BYTES,
+    MMAP_MIN_BYTES,
+    LoadedDocument,
+    load_file,
+    load_folder,
+)
+
+
+def _load(path: Path, base_path: Path):
+    """Call load_file with the size and extension a walk would provide."""
+    return load_file(
+        path,
+        base_path,
+        size_bytes=path.stat().st_size,
+        extension=path.suffix.lower(),
+    )
+
+
+class TestLoadFile:
+    """Tests for load_file function."""
+
+    def test_size_and_extension_are_keyword_only(self, tmp_path):
+        """The old positional (path, base_path) order should fail loudly."""
+        path = tmp_path / "a.txt"
+        path.write_text("x")
+
+        with pytest.raises(TypeError):
+            load_file(path, tmp_path, 1, ".txt")
+
+    def test_loads_text_file(self, tmp_path):
+        """Text files should load with relative path and metadata."""
+        path = tmp_path / "notes.md"
+        path.write_text("Hello")
+
+        doc = _load(path, tmp_path)
+
+        assert isinstance(doc, LoadedDocument)
+        assert doc.relative_path == "notes.md"
+        assert doc.content == "Hello"
+        assert doc.metadata["extension"] == ".md"
+
+    def test_id_hashes_path_and_content(self, tmp_path):
+        """Document ids should depend only on relative path and content."""
+        path = tmp_path / "notes.md"
+        path.write_text("Hello")
+
+        doc = _load(path, tmp_path)
+
+        expected = xxhash.xxh3_128(b"notes.md\nHello").hexdigest()
+        assert doc.id == expected
+
+    def test_skips_binary_file(self, tmp_path):
+        """Files containing null bytes should be skipped."""
+        path = tmp_path / "blob.bin"
+        path.write_bytes(b"abc\x00def")
+
+        assert _load(path, tmp_path) is None
+
+    def test_only_sniffs_file_prefix(self, tmp_path):
+        """Null bytes past the sniffed prefix should not mark a file binary."""
+        path = tmp_path / "log.txt"
+        path.write_bytes(b"a" * BINARY_SNIFF_BYTES + b"\x00")
+
+        doc = _load(path, tmp_path)
+
+        assert doc is not None
+
+    def test_large_file_is_memory_mapped(self, tmp_path):
+        """Files above the mmap threshold should load the same way."""
+        text = "line of text\n" * (MMAP_MIN_BYTES // 10)
+        path = tmp_path / "big.txt"
+        path.write_text(text)
+
+        doc = _load(path, tmp_path)
+
+        assert doc.content == text
+        expected = xxhash.xxh3_128(b"big.txt\n" + text.encode("utf-8")).hexdigest()
+        assert doc.id == expected
+
+    def test_skips_invalid_utf8(self, tmp_path):
+        """Files that are not valid UTF-8 should be skipped."""
+        path = tmp_path / "latin1.txt"
+        path.write_bytes("caf\xe9".encode("latin-1"))
+
+        assert _load(path, tmp_path) is None
+
+
+class TestLoadFolder:
+    """Tests for load_folder function."""
+
+    def test_parallel_matches_serial(self, text_folder):
+        """Process pool loading should match one-by-one loading."""
+        expected = [
+            _load(path, text_folder) for path in sorted(text_folder.glob("*.txt"))
+        ]
+
+        serial = load_folder(text_folder, workers=1)
+        parallel = load_folder(text_folder, workers=2)
+
+        assert serial[0] == expected
+        assert parallel == serial
+        assert serial[2] == 1  # the binary file
+
+    def test_one_worker_loads_serially(self, text_folder, monkeypatch):
+        """workers=1 should not start a process pool."""
+
+        def no_pool(*args, **kwargs):
+            raise AssertionError("pool started")
+
+        monkeypatch.setattr("augustus.ingest.loader.ProcessPoolExecutor", no_pool)
+
+        loaded, _, skipped = load_folder(text_folder, workers=1)
+
+        assert len(loaded) > 0
+        assert skipped == 1
+
+    @pytest.mark.parametrize("workers", [0, -1])
+    def test_rejects_fewer_than_one_worker(self, text_folder, workers):
+        """A worker count below 1 should fail before any file is loaded."""
+        with pytest.raises(ValueError, match="workers must be at least 1"):
+            load_folder(text_folder, workers=workers)
@@ -0,0 +1,27 @@
+"""Tests for the prompt module."""
+
+from augustus.qa.prompt import build_qa_prompt
+
+
+class TestBuildQaPrompt:
+    """Tests for build_qa_prompt function."""
+
+    def test_includes_context_and_question(self):
+        """Each chunk should appear under its source, followed by the question."""
+        prompt = build_qa_prompt(
+            "What is {x}?",
+            [{"source": "a.md", "content": "x is {1}"}, {"content": "more"}],
+        )
+
+        assert "Context:\n[a.md]\nx is {1}\n\n[unknown]\nmore\n\n" in prompt
+        assert prompt.endswith("Question: What is {x}?\n\nAnswer:")
+
+    def test_max_context_chars(self):
+        """Chunks past the budget should be left out."""
+        chunks = [{"source": "a", "content": "x" * 10}, {"source": "b", "content": "y"}]
+
+        full = build_qa_prompt("q", chunks, max_context_chars=21)
+        capped = build_qa_prompt("q", chunks, max_context_chars=20)
+
+        assert "[b]\ny" in full
+        assert "[a]\nxxxxxxxxxx\n\nQuestion" in capped
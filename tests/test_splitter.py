@@ -1,14 +1,22 @@
 """Tests for the document splitter module."""
 
+from concurrent.futures import Future
+
 import pytest
 
 from augustus.ingest.loader import LoadedDocument
 from augustus.ingest.splitter import (
+    PARALLEL_SPLIT_MIN_DOCS,
+    SPLIT_BATCH_SIZE,
+    SPLIT_BATCHES_PER_WORKER,
     DocumentChunk,
     create_splitter,
+    iter_document_chunks,
+    iter_split_documents,
     split_document,
     split_documents,
     split_text,
+    split_text_sliding,
 )
 
 
@@ -41,6 +49,46 @@ class TestSplitText:
         chunks = split_text("", chunk_size=100, chunk_overlap=20)
         assert chunks == []
 
+    def test_min_chunk_size_merges_tiny_chunks(self):
+        """Tiny chunks should join a neighbour that still fits chunk_size."""
+        text = "Intro line here.\n\n}\n\nNext part text."
+
+        plain = split_text(text, chunk_size=18, chunk_overlap=0)
+        merged = split_text(text, chunk_size=18, chunk_overlap=0, min_chunk_size=5)
+
+        assert plain == ["Intro line here.", "}", "Next part text."]
+        assert merged == ["Intro line here.", "}\n\nNext part text."]
+
+    def test_merge_does_not_repeat_overlap(self):
+        """Merged chunks should be spans of the text, not concatenations."""
+        text = "one x two x"
+
+        plain = split_text(text, chunk_size=7, chunk_overlap=4)
+        merged = split_text(text, chunk_size=7, chunk_overlap=4, min_chunk_size=6)
+
+        assert plain == ["one x", "x two", "two x"]
+        assert merged == ["one x", "x two x"]
+
+
+class TestSplitTextSliding:
+    """Tests for split_text_sliding function."""
+
+    def test_windows_overlap_and_cover_text(self):
+        """Windows should step by size minus overlap and reach the end."""
+        chunks = split_text_sliding("abcdefghij", chunk_size=4, chunk_overlap=1)
+
+        assert chunks == ["abcd", "defg", "ghij"]
+
+    def test_short_and_empty_text(self):
+        """Short text should be one chunk and empty text no chunks."""
+        assert split_text_sliding("abc", chunk_size=4, chunk_overlap=1) == ["abc"]
+        assert split_text_sliding("", chunk_size=4, chunk_overlap=1) == []
+
+    def test_rejects_overlap_not_below_size(self):
+        """An overlap as large as the chunk size should raise."""
+        with pytest.raises(ValueError, match="chunk_overlap"):
+            split_text_sliding("abc", chunk_size=4, chunk_overlap=4)
+
 
 class TestCreateSplitter:
     """Tests for create_splitter function."""
@@ -57,6 +105,11 @@ class TestCreateSplitter:
         assert splitter._chunk_size == 500
         assert splitter._chunk_overlap == 50
 
+    def test_reuses_splitter(self):
+        """Equal parameters should return the same splitter object."""
+        assert create_splitter() is create_splitter(1000, 200)
+        assert create_splitter(500, 50) is not create_splitter(500, 60)
+
 
 class TestSplitDocument:
     """Tests for split_document function."""
@@ -112,6 +165,27 @@ class TestSplitDocument:
         assert chunks[0].metadata["extension"] == ".txt"
         assert chunks[0].metadata["source"] == "meta.txt"
 
+    def test_chunks_share_document_metadata(self):
+        """Chunks should not copy the document metadata or write through to it."""
+        doc = LoadedDocument(
+            id="doc1",
+            relative_path="big.txt",
+            content="word " * 100,
+            metadata={"extension": ".txt"},
+        )
+
+        chunks = split_document(doc, chunk_size=100, chunk_overlap=0)
+        chunks[0].metadata["extension"] = ".md"
+
+        assert chunks[1].metadata["extension"] == ".txt"
+        assert doc.metadata == {"extension": ".txt"}
+        assert dict(chunks[1].metadata) == {
+            "extension": ".txt",
+            "source": "big.txt",
+            "chunk_index": 1,
+            "total_chunks": len(chunks),
+        }
+
 
 class TestSplitDocuments:
     """Tests for split_documents function."""
@@ -143,3 +217,92 @@ class TestSplitDocuments:
         """Empty document list should return empty chunk list."""
         chunks = split_documents([])
         assert chunks == []
+
+    def test_parallel_matches_serial(self):
+        """Splitting in a process pool should match splitting in order."""
+        docs = [
+            LoadedDocument(
+                id=f"doc{i}",
+                relative_path=f"file{i}.txt",
+                content=f"Paragraph {i}\n\n" + "word " * (i * 10),
+                metadata={},
+            )
+            for i in range(PARALLEL_SPLIT_MIN_DOCS + 5)
+        ]
+
+        serial = split_documents(
+            docs, chunk_size=100, chunk_overlap=10, max_workers=1
+        )
+        parallel = split_documents(
+            docs, chunk_size=100, chunk_overlap=10, max_workers=2
+        )
+
+        assert parallel == serial
+
+
+class InlinePool:
+    """Stands in for ProcessPoolExecutor, running jobs as they are submitted."""
+
+    instances = []
+
+    def __init__(self, max_workers=None):
+        self.submitted = 0
+        self.shut_down = False
+        InlinePool.instances.append(self)
+
+    def submit(self, fn, *args):
+        self.submitted += 1
+        future = Future()
+        future.set_result(fn(*args))
+        return future
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        self.shut_down = True
+
+
+class TestIterDocumentChunks:
+    """Tests for iter_document_chunks function."""
+
+    def test_work_in_flight_is_bounded(self, monkeypatch):
+        """Only a window of batches should be submitted ahead of the consumer."""
+        monkeypatch.setattr("augustus.ingest.splitter.ProcessPoolExecutor", InlinePool)
+        docs = [
+            LoadedDocument(
+                id=f"doc{i}", relative_path=f"file{i}.txt", content="x", metadata={}
+            )
+            for i in range(SPLIT_BATCH_SIZE * SPLIT_BATCHES_PER_WORKER * 2 * 3)
+        ]
+
+        chunks = iter_document_chunks(docs, max_workers=2)
+        pool = InlinePool.instances[-1]
+
+        # The first window is submitted before anything is consumed
+        window = SPLIT_BATCHES_PER_WORKER * 2
+        assert pool.submitted == window
+        assert next(chunks)[0].source_path == "file0.txt"
+        assert pool.submitted == window + 1
+
+        chunks.close()
+        assert pool.shut_down
+
+
+class TestIterSplitDocuments:
+    """Tests for iter_split_documents function."""
+
+    def test_pulls_documents_lazily(self):
+        """Documents should only be read as their chunks are requested."""
+        pulled = []
+
+        def documents():
+            for name in ["a.txt", "b.txt"]:
+                pulled.append(name)
+                yield LoadedDocument(
+                    id=name, relative_path=name, content="text", metadata={}
+                )
+
+        chunks = iter_split_documents(documents())
+
+        assert pulled == []
+        assert next(chunks).source_path == "a.txt"
+        assert pulled == ["a.txt"]
+        assert [chunk.source_path for chunk in chunks] == ["b.txt"]